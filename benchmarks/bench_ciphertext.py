@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Compare ciphertext size and throughput of the legacy and compact formats.
+
+Run from the repository root: python benchmarks/bench_ciphertext.py
+"""
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crypto_utils import CryptoOperations
+from src.remote_server import RemoteServer
+
+
+def server_contents():
+    server = RemoteServer()
+    return [server._decrypt_file(path, node) if node.is_encrypted else node.content
+            for path, node in server.iter_files()]
+
+
+def legacy_encrypt(crypto, data):
+    return base64.urlsafe_b64encode(crypto.cipher.encrypt(data.encode())).decode()
+
+
+def bench(label, encrypt, decrypt, contents, rounds=200):
+    plain = sum(len(c.encode()) for c in contents)
+    tokens = [encrypt(c) for c in contents]
+    cipher = sum(len(t) for t in tokens)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for c in contents:
+            encrypt(c)
+    enc_rate = plain * rounds / (time.perf_counter() - start) / 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for t in tokens:
+            decrypt(t)
+    dec_rate = plain * rounds / (time.perf_counter() - start) / 1e6
+
+    print(f"{label:<18} {cipher:>8} B ({cipher / plain - 1:+6.1%})"
+          f"  enc {enc_rate:7.2f} MB/s  dec {dec_rate:7.2f} MB/s")
+
+
+if __name__ == "__main__":
+    contents = server_contents()
+    fernet = CryptoOperations()
+    aesgcm = CryptoOperations(mode='aesgcm')
+    print(f"{len(contents)} files, {sum(len(c.encode()) for c in contents)} plaintext bytes")
+    bench("legacy (b64 x2)", lambda c: legacy_encrypt(fernet, c), fernet.decrypt, contents)
+    bench("compact fernet", fernet.encrypt, fernet.decrypt, contents)
+    bench("compact aes-gcm", aesgcm.encrypt, aesgcm.decrypt, contents)
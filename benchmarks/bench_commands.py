@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Measure per-command dispatch overhead as the command count grows.
+
+"rebuilt dict" is the old handle_command shape, which built a dict of
+bound methods on every line; "registry" is the class-level
+CommandRegistry. Both dispatch 'pwd' on a RemoteServer that has extra
+plugin commands registered.
+
+Run from the repository root: python benchmarks/bench_commands.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+
+def plugin(server, args):
+    return ""
+
+
+def server_with(extra):
+    """A RemoteServer subclass with extra plugin commands registered."""
+    class PluginServer(RemoteServer):
+        commands = RemoteServer.commands.copy()
+
+    for i in range(extra):
+        PluginServer.commands.command(f"plugin{i}", "Benchmark plugin")(plugin)
+    return PluginServer()
+
+
+def rebuilt_dict_dispatch(server, extra):
+    """The old shape: build the table, including fresh lambdas, then look up."""
+    def handle(command):
+        parts = command.strip().split()
+        commands = {name: entry.handler.__get__(server)
+                    for name, entry in server.commands.commands.items()}
+        for i in range(extra):
+            commands[f"plugin{i}"] = lambda args: plugin(server, args)
+        return commands[parts[0].lower()](parts[1:])
+    return handle
+
+
+if __name__ == "__main__":
+    number = 20000
+    print(f"{'commands':>8} {'rebuilt dict':>14} {'registry':>10}  (us per dispatch)")
+    for extra in (0, 100, 1000):
+        server = server_with(extra)
+        old = rebuilt_dict_dispatch(server, extra)
+        count = len(server.commands)
+        old_number = number // (1 + extra // 100)  # The old shape gets slow
+        old_us = timeit.timeit(lambda: old("pwd"), number=old_number) / old_number * 1e6
+        new_us = timeit.timeit(lambda: server.handle_command("pwd"), number=number) / number * 1e6
+        print(f"{count:>8} {old_us:>14.2f} {new_us:>10.2f}")
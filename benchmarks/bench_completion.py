@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Measure tab completion latency on a server with a very large tree.
+
+Run from the repository root: python benchmarks/bench_completion.py
+"""
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+FILES = 100000
+DIRS = 1000
+
+
+def naive_complete(server, word):
+    """Scan every path on the server, as a flat completion list would."""
+    return [path for path, _ in server.iter_files() if path.startswith(word)]
+
+
+def per_call_ms(func, number=200):
+    return timeit.timeit(func, number=number) / number * 1000
+
+
+if __name__ == "__main__":
+    server = RemoteServer()
+    start = time.perf_counter()
+    for i in range(FILES):
+        server._add_file(f"/data/shard_{i % DIRS:04d}/record_{i:06d}.log", "record")
+    print(f"{FILES} files in {DIRS} directories added in {time.perf_counter() - start:.1f} s")
+
+    cases = [
+        ("command name", "gr"),
+        ("top-level dir", "cat /da"),
+        ("1000-entry dir", "cat /data/shard_07"),
+        ("file in shard", "cat /data/shard_0042/record_0"),
+    ]
+    for label, line in cases:
+        ms = per_call_ms(lambda: server.complete(line))
+        print(f"{label:<16} {ms:8.3f} ms  ({len(server.complete(line))} matches)")
+
+    word = "/data/shard_0042/record_0"
+    print(f"{'naive full scan':<16} {per_call_ms(lambda: naive_complete(server, word), 5):8.3f} ms")
+
+    server._add_file("/data/shard_0042/record_new.log", "fresh")
+    ms = per_call_ms(lambda: server.complete("cat /data/shard_0042/record_n"))
+    print(f"{'after an add':<16} {ms:8.3f} ms  {server.complete('cat /data/shard_0042/record_n')}")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Measure the cost of setting up an ip_connect session.
+
+Run from the repository root: python benchmarks/bench_connect.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import crypto_utils
+from src.crypto_utils import CryptoOperations
+from src.remote_server import RemoteServer
+
+
+def legacy_connect():
+    """What ip_connect used to pay: two full derivations up front."""
+    for _ in range(2):
+        crypto_utils.clear_key_cache()
+        CryptoOperations().encrypt("x")
+    RemoteServer()
+
+
+def cached_connect():
+    crypto = CryptoOperations()
+    server = RemoteServer()
+    crypto.encrypt("x")
+    server.crypto.encrypt("x")
+
+
+def bench(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<28} {elapsed * 1000:9.2f} ms/connect")
+
+
+if __name__ == "__main__":
+    bench("before (no key cache)", legacy_connect, 5)
+    crypto_utils.clear_key_cache()
+    bench("after (first connect)", cached_connect, 1)
+    bench("after (repeat connects)", cached_connect, 50)
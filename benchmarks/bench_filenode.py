@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare bytes per file for the old dataclass FileNode and the slotted one.
+
+Run from the repository root: python benchmarks/bench_filenode.py [files]
+"""
+import datetime
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import FileNode, day_stamp
+
+OWNERS = ["root", "admin", "researcher", "security"]
+TYPES = ["txt", "log", "dat", "bin"]
+
+
+@dataclass
+class LegacyFileNode:
+    name: str
+    content: str
+    is_encrypted: bool = False
+    is_hidden: bool = False
+    permissions: str = "rw-r--r--"
+    created_date: str = "2024-12-01"
+    modified_date: str = "2024-12-01"
+    file_size: int = 0
+    owner: str = "root"
+    type: str = "txt"
+
+
+def generated(i):
+    """Metadata as a generator would produce it: fresh, non-interned strings."""
+    offset = random.randint(0, 60)
+    date = datetime.date.today() - datetime.timedelta(days=offset)
+    return dict(
+        name=f"file_{i:06d}.{TYPES[i % 4]}",
+        content=f"generated record {i} " * 4,
+        permissions="".join(["rw-", "r--", "r--"]),
+        owner="".join(OWNERS[i % 4]),
+        type="".join(TYPES[i % 4]),
+        date=date,
+    )
+
+
+def measure(make, count):
+    random.seed(0)
+    tracemalloc.start()
+    nodes = [make(generated(i)) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / len(nodes)
+
+
+def legacy(meta):
+    return LegacyFileNode(meta["name"], meta["content"], permissions=meta["permissions"],
+                          created_date=meta["date"].strftime('%Y-%m-%d'),
+                          modified_date=meta["date"].strftime('%Y-%m-%d'),
+                          owner=meta["owner"], type=meta["type"])
+
+
+def slotted(meta):
+    day = day_stamp(meta["date"])
+    return FileNode(meta["name"], meta["content"], permissions=meta["permissions"],
+                    created_day=day, modified_day=day, owner=meta["owner"], type=meta["type"])
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    old = measure(legacy, count)
+    new = measure(slotted, count)
+    print(f"{count} files")
+    print(f"dataclass FileNode  {old:8.1f} bytes/file")
+    print(f"slotted FileNode    {new:8.1f} bytes/file ({new / old - 1:+.1%})")
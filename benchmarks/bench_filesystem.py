@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Time dir/cd/cat on a server with a large generated directory tree.
+
+Run from the repository root: python benchmarks/bench_filesystem.py [dirs]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+
+def build_server(n_dirs):
+    server = RemoteServer()
+    for i in range(n_dirs):
+        server._add_directory(f"/data/shard_{i % 100:02d}/node_{i:06d}")
+    server._add_file("/data/shard_07/node_000007/notes.txt", "generated")
+    return server
+
+
+def legacy_list(flat_paths, path):
+    """The old dir algorithm: scan and sort every directory path."""
+    return [d.split("/")[-1] for d in sorted(flat_paths)
+            if d.startswith(path + "/") and d.count("/") == path.count("/") + 1]
+
+
+def bench(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<24} {elapsed * 1e6:10.1f} us/op")
+
+
+if __name__ == "__main__":
+    n_dirs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    server = build_server(n_dirs)
+    flat_paths = [d.path for d in server.filesystem.walk()]
+    print(f"{len(flat_paths)} directories")
+
+    bench("dir /home (legacy)", lambda: legacy_list(flat_paths, "/home"), 20)
+    bench("dir /home (tree)", lambda: server.handle_command("dir /home"), 2000)
+    bench("dir /data (tree)", lambda: server.handle_command("dir /data"), 2000)
+    bench("cd deep path", lambda: server.handle_command("cd /data/shard_07/node_000007"), 20000)
+    bench("cat deep file", lambda: server.handle_command("cat /data/shard_07/node_000007/notes.txt"), 20000)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Compare four separate digest passes with the single-pass hash_stream.
+
+Run from the repository root: python benchmarks/bench_hashing.py
+"""
+import hashlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crypto_utils import HASH_ALGORITHMS, CryptoOperations
+
+
+def four_passes(text):
+    return {name: hashlib.new(name, text.encode()).hexdigest() for name in HASH_ALGORITHMS}
+
+
+def timed(label, size, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {size / elapsed / 1e6:8.1f} MB/s")
+    return result
+
+
+if __name__ == "__main__":
+    for mb in (1, 64):
+        text = "voidborn log line 0123456789\n" * (mb * 1024 * 1024 // 29)
+        data = text.encode()
+        print(f"{len(data) / 1e6:.0f} MB input")
+        expected = timed("  four passes over str", len(data), lambda: four_passes(text))
+        serial, _ = timed("  hash_stream, serial", len(data), lambda: CryptoOperations.hash_stream(
+            io.BytesIO(data), parallel_threshold=len(data)))
+        parallel, _ = timed("  hash_stream, threaded", len(data), lambda: CryptoOperations.hash_stream(
+            io.BytesIO(data), parallel_threshold=0))
+        assert expected == serial == parallel
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Lines per second for per-line and bulk log generation.
+
+Run from the repository root: python benchmarks/bench_logs.py [lines]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.log_generator import LogGenerator
+
+
+def legacy_generate_log(gen):
+    """generate_log() as it was: rebuild the method list, strftime every line."""
+    log_types = [
+        gen._log_network, gen._log_firewall, gen._log_auth,
+        gen._log_system, gen._log_crypto, gen._log_exploit,
+        gen._log_scan, gen._log_access, gen._log_database,
+        gen._log_malware
+    ]
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    return f"{timestamp} {random.choice(log_types)()}"
+
+
+def bench(label, func, lines):
+    start = time.perf_counter()
+    func()
+    rate = lines / (time.perf_counter() - start)
+    print(f"{label:<28} {rate:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    gen = LogGenerator()
+    path = os.path.join(tempfile.mkdtemp(), "bench.log")
+
+    def per_line_to_file():
+        with open(path, "w") as f:
+            for _ in range(lines):
+                f.write(gen.generate_log() + "\n")
+
+    bench("original generate_log()", lambda: [legacy_generate_log(gen) for _ in range(lines)], lines)
+    bench("generate_log() loop", lambda: [gen.generate_log() for _ in range(lines)], lines)
+    bench("generate_logs(n)", lambda: list(gen.generate_logs(lines)), lines)
+    bench("generate_log() -> file", per_line_to_file, lines)
+    bench("write_logs(path, n)", lambda: gen.write_logs(path, lines), lines)
+    os.remove(path)
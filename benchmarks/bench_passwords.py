@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Measure password verifications per second under concurrent sessions.
+
+Compares verify_password called inline on the event loop with
+verify_password_async on the shared password pool, and reports how long
+the loop was blocked (worst gap between ticks of a 10 ms heartbeat).
+
+Run from the repository root: python benchmarks/bench_passwords.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crypto_utils import PASSWORD_WORKERS, CryptoOperations
+
+VERIFICATIONS = 4  # Per session
+
+
+async def heartbeat(stop, gaps):
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.01)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def run(sessions, inline):
+    crypto = CryptoOperations()
+    stored = crypto.hash_password("hunter2")
+
+    async def session(i):
+        for attempt in range(VERIFICATIONS):
+            password = "hunter2" if attempt % 2 else "wrong"
+            if inline:
+                crypto.verify_password(stored, password)
+                await asyncio.sleep(0)
+            else:
+                await asyncio.wrap_future(
+                    crypto.verify_password_async(stored, password, user=f"user{i}"))
+
+    stop, gaps = asyncio.Event(), []
+    beat = asyncio.create_task(heartbeat(stop, gaps))
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    return sessions * VERIFICATIONS / elapsed, max(gaps) * 1000
+
+
+if __name__ == "__main__":
+    print(f"{PASSWORD_WORKERS} password workers")
+    for sessions in (1, 4, 16):
+        for label, inline in (("inline", True), ("pool", False)):
+            rate, lag = asyncio.run(run(sessions, inline))
+            print(f"{sessions:>3} sessions {label:<7} {rate:8.1f} verifications/s"
+                  f"  worst loop stall {lag:8.1f} ms")
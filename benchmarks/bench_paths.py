@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Micro-benchmark path resolution over a realistic command trace.
+
+Run from the repository root: python benchmarks/bench_paths.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+# A typical exploration session: wander, list, read, back out
+TRACE = [
+    "dir", "cd admin", "dir", "cat access_log.txt", "cd ..", "cd researcher",
+    "cat experiment_log_042.txt", "cd ../security", "dir", "cat incident_report_17.txt",
+    "cd /research", "dir", "cd logs", "dir", "cat experiment_001.log", "cd ../classified",
+    "dir", "cat ./void_incursion.log", "cd /var/log", "cat auth.log",
+    "cat /var/log/security_recent.log", "cd ../../home", "dir ../blackbox",
+    "cat /blackbox/README.txt", "pwd",
+]
+
+
+def path_calls(server):
+    """Record the (current_path, argument) pairs the trace resolves."""
+    calls = []
+    for command in TRACE:
+        parts = command.split()
+        if len(parts) > 1 or parts[0] == "dir":
+            calls.append((server.current_path, parts[1] if len(parts) > 1 else server.current_path))
+        server.handle_command(command)
+    return calls
+
+
+def bench(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<30} {elapsed * 1e6:9.2f} us/trace")
+
+
+if __name__ == "__main__":
+    server = RemoteServer()
+    calls = path_calls(server)
+
+    def uncached():
+        for current, path in calls:
+            RemoteServer._resolve_path(current, path)
+
+    def cached():
+        for current, path in calls:
+            server.current_path = current
+            server._normalize_path(path)
+
+    def full_trace():
+        server.current_path = "/home"
+        for command in TRACE:
+            server.handle_command(command)
+
+    print(f"{len(calls)} path resolutions per trace")
+    bench("resolve (uncached)", uncached, 20000)
+    bench("resolve (LRU cache)", cached, 20000)
+    bench("full command trace", full_trace, 2000)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Record a long scripted session, then measure replay, seeking and file size.
+
+Run from the repository root: python benchmarks/bench_replay.py
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from src.session_record import SessionPlayer, SessionRecorder
+from src.terminal_effects import TerminalEffects
+
+SCENARIO = ["dir", "cd documents", "type secrets.txt", "ip_connect 192.168.13.666",
+            "dir /", "cat /etc/passwd", "grep -l admin", "hash /etc/passwd",
+            "decrypt /etc/shadow", "cat /etc/shadow", "exit"]
+ROUNDS = 300
+
+
+class FakeClock:
+    """Simulated time: output is near-instant, players think before typing."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.0005
+        return self.now
+
+
+def record(path):
+    """Record ROUNDS plays of SCENARIO the way main.py records a session."""
+    TerminalEffects.set_mode('headless')
+    clock = FakeClock()
+    recorder = SessionRecorder(path, clock=clock)
+    raw = 0
+    for _ in range(ROUNDS):
+        home_pc = main.HomeComputer()
+        for command in SCENARIO:
+            captured = io.StringIO()
+            recorder.output(home_pc.prompt)
+            clock.now += 1.5
+            recorder.input(command)
+            with contextlib.redirect_stdout(captured):
+                output = home_pc.handle_command(command)
+            output = captured.getvalue() + (output + "\n" if output else "")
+            recorder.output(output)
+            raw += len((home_pc.prompt + command + "\n" + output).encode())
+    recorder.close()
+    return raw
+
+
+def timed(func, number=1):
+    start = time.perf_counter()
+    for _ in range(number):
+        result = func()
+    return (time.perf_counter() - start) / number, result
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.jsonl")
+        raw = record(path)
+        size = os.path.getsize(path)
+        player = SessionPlayer(path)
+        print(f"{player.events} events, {player.duration:.0f} s recorded, {len(player.index)} keyframes")
+        print(f"file {size / 1024:.0f} KiB for {raw / 1024:.0f} KiB of output ({size / raw:.2f}x)")
+
+        took, chars = timed(lambda: player.play(io.StringIO(), speed=None))
+        print(f"instant replay      {took * 1000:8.1f} ms  ({chars / took / 1e6:.1f} M chars/s)")
+
+        sleeps = []
+        took, _ = timed(lambda: player.play(io.StringIO(), speed=60.0, sleep=sleeps.append))
+        print(f"60x replay          {took * 1000:8.1f} ms  (+{sum(sleeps):.1f} s of scheduled sleeps)")
+
+        end = player.duration * 0.9
+        took, _ = timed(lambda: next(player.read(end)), number=50)
+        print(f"seek to 90% (keyframe)      {took * 1000:8.3f} ms")
+        took, _ = timed(lambda: [e for e in player.read(0) if e[0] < end], number=3)
+        print(f"seek to 90% (decode all)    {took * 1000:8.3f} ms")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Time grep/search on a server with many generated files.
+
+Run from the repository root: python benchmarks/bench_search.py [files]
+"""
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+WORDS = ("containment sector shadow breach entity report status sonic barrier "
+         "protocol research void signal anomaly quantum field generator").split()
+VOCABULARY_SIZE = 300000  # Distinct tokens, roughly what real text of this size holds
+
+
+def make_vocabulary(size):
+    """Common game words plus many rarer made-up ones, like names and ids."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    rare = {"".join(random.choices(letters, k=random.randint(4, 10))) for _ in range(size)}
+    rare.difference_update(WORDS)
+    return WORDS + sorted(rare)
+
+
+def build_server(n_files):
+    random.seed(0)
+    vocabulary = make_vocabulary(VOCABULARY_SIZE)
+    # Zipf-like: the first words are common, most appear in a file or two
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    server = RemoteServer()
+    for i in range(n_files):
+        body = " ".join(random.choices(vocabulary, cum_weights=weights, k=40))
+        if i == n_files // 2:
+            body += "\nOverride phrase: NEEDLE-4242 confirmed"
+        server._add_file(f"/archive/batch_{i % 200:03d}/record_{i:06d}.txt", body)
+    return server
+
+
+def naive_grep(server, needle):
+    """What players did before: cat every file and look."""
+    return [path for path, node in server.iter_files()
+            if not node.is_encrypted and needle in node.content]
+
+
+def bench(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<34} {elapsed * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    start = time.perf_counter()
+    server = build_server(n_files)
+    print(f"{n_files} files indexed in {time.perf_counter() - start:.1f}s")
+
+    bench("naive scan for NEEDLE-4242", lambda: naive_grep(server, "NEEDLE-4242"), 3)
+    bench("grep NEEDLE-4242", lambda: server.handle_command("grep NEEDLE-4242"), 50)
+    bench("grep -l OMEGA", lambda: server.handle_command("grep -l OMEGA"), 50)
+    bench("grep -l omeg (partial word)", lambda: server.handle_command("grep -l omeg"), 50)
+    bench("search omega", lambda: server.handle_command("search omega"), 50)
+    bench("search needle confirmed", lambda: server.handle_command("search needle confirmed"), 50)
+    bench("grep -l in one batch dir", lambda: server.handle_command("grep -l shadow /archive/batch_007"), 5)
+    bench("grep -E (full scan fallback)", lambda: server.handle_command("grep -E -l NEEDLE-\\d+"), 1)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Measure memory held by many concurrent RemoteServer sessions.
+
+Run from the repository root: python benchmarks/bench_sessions.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.remote_server import RemoteServer
+
+
+def measure(count, shared, mutate):
+    RemoteServer._shared_image()  # Build the base image outside the measurement
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    servers = []
+    for i in range(count):
+        server = RemoteServer(use_shared_image=shared)
+        if mutate:
+            server._add_file(f"/home/admin/session_{i}.txt", "scratch notes")
+        servers.append(server)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+if __name__ == "__main__":
+    print(f"{'sessions':>8} {'full copy':>12} {'shared':>12} {'shared+write':>14}  (bytes/session)")
+    for count in (1, 100, 1000):
+        full = measure(count, False, False) // count
+        shared = measure(count, True, False) // count
+        written = measure(count, True, True) // count
+        print(f"{count:>8} {full:>12} {shared:>12} {written:>14}")
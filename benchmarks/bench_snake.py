@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Time snake ticks and food placement as the snake grows to fill the board.
+
+Run from the repository root: python benchmarks/bench_snake.py [width height]
+"""
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ascii_games import CellIndex, SnakeGame
+
+
+def serpentine(width, height):
+    """Visit every cell so consecutive cells are adjacent."""
+    for y in range(height):
+        xs = range(width) if y % 2 == 0 else range(width - 1, -1, -1)
+        for x in xs:
+            yield (x, y)
+
+
+def make_game(width, height, length):
+    path = list(serpentine(width, height))
+    game = SnakeGame(width, height)
+    game.snake = deque(reversed(path[:length]))
+    game.occupied = set(game.snake)
+    game.free = CellIndex(c for c in path if c not in game.occupied)
+    game.food = path[-1]
+    return game, path
+
+
+def legacy_place_food(width, height, snake):
+    while True:
+        food = (random.randint(0, width - 1), random.randint(0, height - 1))
+        if food not in snake:
+            return food
+
+
+def legacy_tick(snake, new_head, food):
+    if new_head in snake:
+        return
+    snake.insert(0, new_head)
+    if new_head != food:
+        snake.pop()
+
+
+def per_op(func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+if __name__ == "__main__":
+    width, height = (int(a) for a in sys.argv[1:3]) if len(sys.argv) > 2 else (32, 32)
+    cells = width * height
+    print(f"{width}x{height} board; times in microseconds")
+    print(f"{'length':>7} {'tick old':>10} {'tick new':>10} {'food old':>10} {'food new':>10}")
+    for length in sorted({1, cells // 4, cells // 2, cells * 3 // 4, cells - 3, cells - 1}):
+        ticks = max(1, min(200, cells - length - 2))
+        game, path = make_game(width, height, length)
+        start = time.perf_counter()
+        for i in range(ticks):
+            head, nxt = path[length - 1 + i], path[length + i]
+            game.direction = (nxt[0] - head[0], nxt[1] - head[1])
+            game._move_snake()
+        tick_new = (time.perf_counter() - start) / ticks * 1e6
+
+        snake = list(reversed(path[:length]))
+        start = time.perf_counter()
+        for i in range(ticks):
+            legacy_tick(snake, path[length + i], path[-1])
+        tick_old = (time.perf_counter() - start) / ticks * 1e6
+
+        game, _ = make_game(width, height, length)
+        snake = list(game.snake)
+        rounds = 20 if length > cells - 4 else 200
+        food_old = per_op(lambda: legacy_place_food(width, height, snake), rounds)
+        food_new = per_op(game._place_food, 2000)
+        print(f"{length:>7} {tick_old:>10.2f} {tick_new:>10.2f} {food_old:>10.1f} {food_new:>10.2f}")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Measure time-to-first-prompt of main.py and what it imports before it.
+
+main.py is run in a fresh interpreter with headless effects, and stopped
+at its first input() prompt. The script reports the median wall time
+over several runs, and uses -X importtime to list the slowest imports
+made before the prompt. It exits with status 1 when startup regresses,
+i.e. when:
+- the median exceeds --max-ms, or
+- a lazily loaded subsystem was imported before the prompt.
+
+Run from the repository root: python benchmarks/bench_startup.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget for interpreter start to first prompt, in milliseconds
+MAX_FIRST_PROMPT_MS = 150
+# Modules that must not be loaded before the first prompt
+FORBIDDEN_AT_PROMPT = ('cryptography', 'src.crypto_utils', 'src.remote_server',
+                       'src.ascii_games', 'src.log_generator')
+
+# Runs main.py as __main__ and exits as soon as it asks for input
+FIRST_PROMPT_HOOK = """
+import builtins, os, runpy, sys
+def first_prompt(prompt=''):
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    sys.stderr.write('FIRST_PROMPT ' + ' '.join(sorted(sys.modules)) + '\\n')
+    sys.stderr.flush()
+    os._exit(0)
+builtins.input = first_prompt
+sys.argv = ['main.py']
+runpy.run_path('main.py', run_name='__main__')
+"""
+
+
+def run_to_prompt(importtime=False):
+    """Run main.py up to its first prompt; returns (seconds, stderr lines)."""
+    env = dict(os.environ, VOIDBORN_EFFECTS='headless', VOIDBORN_PREWARM='0')
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', FIRST_PROMPT_HOOK]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, env=env, stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    lines = result.stderr.splitlines()
+    if not any(line.startswith('FIRST_PROMPT ') for line in lines):
+        raise RuntimeError(f"main.py never reached its prompt:\n{result.stderr}")
+    return elapsed, lines
+
+
+def slowest_imports(lines, count):
+    """(cumulative us, module) for the slowest imports before the prompt."""
+    imports = []
+    for line in lines:
+        if line.startswith('FIRST_PROMPT '):
+            break
+        if line.startswith('import time:'):
+            # "import time: self [us] | cumulative | imported package"
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark main.py time-to-first-prompt")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=MAX_FIRST_PROMPT_MS)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    times = [run_to_prompt()[0] * 1000 for _ in range(args.runs)]
+    median = statistics.median(times)
+    _, lines = run_to_prompt(importtime=True)
+    loaded = next(line for line in lines if line.startswith('FIRST_PROMPT ')).split()[1:]
+
+    print(f"time to first prompt: median {median:.1f} ms, min {min(times):.1f} ms"
+          f" over {args.runs} runs (budget {args.max_ms:g} ms)")
+    print(f"{len(loaded)} modules loaded at the prompt; slowest imports (cumulative):")
+    for cumulative, name in slowest_imports(lines, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    early = [name for name in FORBIDDEN_AT_PROMPT if name in loaded]
+    failures = []
+    if median > args.max_ms:
+        failures.append(f"median {median:.1f} ms is over the {args.max_ms:g} ms budget")
+    if early:
+        failures.append("loaded before the prompt: " + ", ".join(early))
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    sys.exit(1 if failures else 0)
@@ -1,27 +1,59 @@
 #!/usr/bin/env python3
+import argparse
+import contextlib
+import importlib
+import io
+import json
 import os
 import sys
+import threading
 import time
-from typing import List, Dict
-from src.crypto_utils import CryptoOperations
+from typing import List, Dict, Iterable, Optional, TextIO, Tuple
+from src.commands import CommandRegistry
+from src.completion import install_completion, split_line
 from src.terminal_effects import TerminalEffects
-from src.log_generator import LogGenerator
-from src.remote_server import RemoteServer
-from src.ascii_games import SnakeGame
+
+# Subsystems are imported on first use (ip_connect, run snake.exe) so the
+# home terminal comes up without loading cryptography and friends.
+# prewarm() imports them on a background thread while the intro types;
+# set VOIDBORN_PREWARM=0 to turn that off.
+LAZY_MODULES = ('src.remote_server', 'src.ascii_games')
+
+def prewarm() -> threading.Thread:
+    """Import the lazy subsystems and build the server image in the background."""
+    def load():
+        try:
+            for name in LAZY_MODULES:
+                importlib.import_module(name)
+            from src.remote_server import RemoteServer
+            RemoteServer._shared_image()  # Also derives the file encryption key
+        except Exception:
+            pass  # Anything that failed is retried, and reported, on first use
+
+    thread = threading.Thread(target=load, name='prewarm', daemon=True)
+    thread.start()
+    return thread
 
 def display_home_computer():
     effects = TerminalEffects()
     effects.clear_screen()
     effects.type_text("\033[1;32m=== HOME TERMINAL ===\033[0m")
     effects.type_text("\nJust another boring night...")
-    time.sleep(0.5)
+    effects.pause(0.5)
     effects.type_text("\nScrolling through old files...")
-    time.sleep(0.3)
+    effects.pause(0.3)
     effects.type_text("\nType 'help' for available commands.\n")
 
+SERVER_IP = "192.168.13.666"
+
 class HomeComputer:
+    # Built once as the handlers below are defined; plugins may add to it
+    commands = CommandRegistry(help_width=9, usage_error="Syntax error. Usage: {usage}")
+
     def __init__(self):
         self.effects = TerminalEffects()
+        self.remote = None  # RemoteServer while connected
+        self.running = True  # Cleared by the 'exit' command
         # Simplified directory structure
         self.files = {
             'DOCUMENTS': ['todo.txt', 'work.txt', 'SECRETS.txt'],
@@ -49,6 +81,7 @@ WHOEVER FINDS THIS, BE CAREFUL""",
         }
         self.current_dir = 'C:'
 
+    @commands.command('dir', "List directory contents", aliases=('ls',))
     def _dir(self, args=None):
         """List directory contents."""
         output = [
@@ -78,6 +111,7 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         return "\n".join(output)
 
+    @commands.command('cd', "Change directory", usage="cd [directory]")
     def _cd(self, args):
         """Change directory."""
         if not args:
@@ -95,6 +129,7 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         return f"Invalid directory {args[0]}"
 
+    @commands.command('type', "Display file contents", usage="type <file>", aliases=('cat',))
     def _type(self, args):
         """Display file contents."""
         if not args:
@@ -112,6 +147,7 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         return f"File not found - {filename}"
 
+    @commands.command('run', "Run a program (e.g., 'run snake.exe')", usage="run <program>")
     def _run(self, args):
         """Run a program (game)."""
         if not args:
@@ -122,7 +158,12 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         program = args[0].lower()
         if program == 'snake.exe':
+            if TerminalEffects.mode == 'headless':
+                # Real-time games need a keyboard and the screen; raising
+                # lets --script mode count this as an error
+                raise RuntimeError(f"{program} needs an interactive terminal")
             try:
+                from src.ascii_games import SnakeGame
                 effects = TerminalEffects()
                 effects.clear_screen()
                 game = SnakeGame(width=20, height=10)
@@ -135,8 +176,66 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         return f"Cannot run {program}"
 
+    @commands.command('cls', "Clear screen", aliases=('clear',))
+    def _cls(self, args):
+        """Clear the screen."""
+        return self.effects.clear_screen() or ""
+
+    @commands.command('help', "Show this help message", usage="help [command]")
+    def _help(self, args):
+        """Display help information."""
+        return self.commands.help_text(args[0] if args else None)
+
+    @commands.command('ip_connect', "Connect to remote server", usage="ip_connect <ip>",
+                      min_args=1, max_args=1)
+    def _ip_connect(self, args):
+        """Connect to the remote server; later commands go to it until 'exit'."""
+        if args[0] != SERVER_IP:
+            return f"Connection failed: Could not reach {args[0]}"
+        if not connect_to_server(SERVER_IP):
+            return ""
+        from src.log_generator import LogGenerator
+        from src.remote_server import RemoteServer
+        remote = RemoteServer(log_generator=LogGenerator())
+        if remote.start_session():
+            self.remote = remote
+        return ""
+
+    @commands.command('exit', "Exit terminal")
+    def _exit(self, args):
+        """Leave the terminal."""
+        self.running = False
+        self.effects.type_text("\nTerminating session... Goodbye!")
+        return ""
+
+    @property
+    def prompt(self) -> str:
+        """Prompt for the shell that receives the next command."""
+        if self.remote is not None:
+            return f"{self.remote.current_path}> "
+        return f"{self.current_dir}> "
+
+    def complete(self, line: str) -> List[str]:
+        """Tab completions for the word at the end of line."""
+        if self.remote is not None:
+            return self.remote.complete(line)
+        words, word = split_line(line)
+        if not words:
+            return self.commands.complete(word)
+        if self.current_dir == 'C:':
+            names = sorted(self.files)
+        else:
+            names = sorted(self.files.get(self.current_dir.split('\\')[-1], []))
+        return [name for name in names if name.upper().startswith(word.upper())]
+
     def handle_command(self, command: str) -> str:
         """Process user commands and return output."""
+        if self.remote is not None:
+            output = self.remote.handle_command(command)
+            if not self.remote.connected:
+                self.remote = None
+            return output
+
         command = command.strip()
 
         # Handle empty or numeric-only inputs
@@ -145,28 +244,10 @@ WHOEVER FINDS THIS, BE CAREFUL""",
 
         parts = command.split()
         cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-
-        commands = {
-            'dir': self._dir,
-            'cd': self._cd,
-            'type': self._type,
-            'cls': lambda _: self.effects.clear_screen() or "",
-            'run': self._run,
-            'help': lambda _: """Available commands:
-dir      - List directory contents
-cd       - Change directory
-type     - Display file contents
-run      - Run a program (e.g., 'run snake.exe')
-cls      - Clear screen
-help     - Show this help message
-ip_connect <ip> - Connect to remote server
-exit     - Exit terminal""",
-            'ip_connect': lambda _: None
-        }
+        args = parts[1:]
 
-        if cmd in commands:
-            return commands[cmd](args)
+        if cmd in self.commands:
+            return self.commands.dispatch(self, cmd, args)
         return f"Bad command or file name: {parts[0]}"
 
 def connect_to_server(ip):
@@ -176,54 +257,119 @@ def connect_to_server(ip):
     effects.matrix_effect(0.8)  # Reduced time for better UX
     return True
 
-def main():
+def run_script(lines: Iterable[str], out: TextIO, output_format: str = 'text',
+               script: str = '-') -> Tuple[int, int, float]:
+    """
+    Feed commands to a fresh HomeComputer without prompting.
+
+    Everything a command prints, including effects, is captured with its
+    return value. Each command is written to out as a transcript entry
+    ('text') or as one JSON object per line ('jsonl'). Stops at 'exit'.
+
+    Returns:
+        (commands run, commands that raised, seconds spent running them)
+    """
+    home_pc = HomeComputer()
+    count = 0
+    errors = 0
+    elapsed = 0.0
+    for line in lines:
+        command = line.rstrip("\r\n")
+        prompt = home_pc.prompt
+        captured = io.StringIO()
+        start = time.perf_counter()
+        error = None
+        with contextlib.redirect_stdout(captured):
+            try:
+                output = home_pc.handle_command(command) or ""
+            except Exception as e:
+                output, error = "", str(e)
+                errors += 1
+        took = time.perf_counter() - start
+        elapsed += took
+        count += 1
+
+        output = captured.getvalue() + output
+        if output_format == 'jsonl':
+            record = {'script': script, 'n': count, 'prompt': prompt, 'command': command,
+                      'output': output, 'error': error, 'ms': round(took * 1000, 3)}
+            out.write(json.dumps(record) + "\n")
+        else:
+            out.write(f"{prompt}{command}\n")
+            if output:
+                out.write(output if output.endswith("\n") else output + "\n")
+            if error:
+                out.write(f"Command error: {error}\n")
+        if not home_pc.running:
+            break
+
+    if home_pc.remote is not None:
+        home_pc.remote.close()
+    return count, errors, elapsed
+
+def run_scripts(paths: List[str], output_format: str) -> int:
+    """
+    Run each script ('-' for stdin) in batch mode and report throughput on stderr.
+    Returns the exit status: 1 if a command raised or a script could not be read.
+    """
+    TerminalEffects.set_mode('headless')
+    total = 0
+    errors = 0
+    elapsed = 0.0
+    for path in paths:
+        try:
+            with (contextlib.nullcontext(sys.stdin) if path == '-' else open(path)) as lines:
+                count, failed, took = run_script(lines, sys.stdout, output_format, path)
+        except OSError as e:
+            print(f"Cannot read script {path}: {e.strerror or e}", file=sys.stderr)
+            errors += 1
+            continue
+        total += count
+        errors += failed
+        elapsed += took
+
+    rate = total / elapsed if elapsed else 0.0
+    summary = {'scripts': len(paths), 'commands': total, 'errors': errors,
+               'seconds': round(elapsed, 6), 'commands_per_sec': round(rate, 1)}
+    if output_format == 'jsonl':
+        print(json.dumps(summary), file=sys.stderr)
+    else:
+        print(f"{total} commands from {len(paths)} script(s) in {elapsed:.3f} s"
+              f" ({rate:,.0f} commands/s), {errors} error(s)", file=sys.stderr)
+    return 1 if errors else 0
+
+def read_command(prompt: str, recorder=None) -> str:
+    """input(), also recording the prompt and the line when recording."""
+    if recorder is None:
+        return input(prompt)
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        recorder.output(prompt)  # readline draws the prompt itself, past the tee
+    line = input(prompt)
+    recorder.input(line)
+    return line
+
+def run_interactive(recorder=None):
     effects = TerminalEffects()
     home_pc = HomeComputer()
 
+    if os.environ.get('VOIDBORN_PREWARM', '1') != '0':
+        prewarm()
+    if sys.stdin.isatty():
+        install_completion(home_pc)
+
     try:
         display_home_computer()
 
-        while True:
+        while home_pc.running:
             try:
-                command = input(f"{home_pc.current_dir}> ").strip()
-
-                if command.lower() == "exit":
-                    effects.type_text("\nTerminating session... Goodbye!")
-                    break
-
-                if command.startswith("ip_connect"):
-                    parts = command.split()
-                    if len(parts) != 2:
-                        print("Syntax error. Usage: ip_connect <ip>")
-                        continue
-
-                    if parts[1] == "192.168.13.666":
-                        if connect_to_server("192.168.13.666"):
-                            crypto = CryptoOperations()
-                            log_gen = LogGenerator()
-                            remote_server = RemoteServer()
-
-                            if remote_server.start_session():
-                                while True:
-                                    try:
-                                        user_input = input(f"{remote_server.current_path}> ")
-                                        if user_input.lower() == 'exit':
-                                            effects.type_text("\n[!] Connection terminated")
-                                            break
-
-                                        output = remote_server.handle_command(user_input)
-                                        if output:
-                                            print(output)
-                                    except KeyboardInterrupt:
-                                        print("\n[!] Command interrupted")
-                                        continue
-                    else:
-                        print(f"Connection failed: Could not reach {parts[1]}")
-                else:
-                    output = home_pc.handle_command(command)
-                    if output:
-                        print(output)
-
+                command = read_command(home_pc.prompt, recorder)
+                output = home_pc.handle_command(command)
+                if output:
+                    print(output)
+            except KeyboardInterrupt:
+                if home_pc.remote is None:
+                    raise
+                print("\n[!] Command interrupted")
             except Exception as e:
                 print(f"Command error: {str(e)}")
                 continue
@@ -235,5 +381,29 @@ def main():
         effects.type_text("[!] SYSTEM TERMINATED")
         sys.exit(0)
 
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="VOIDBORN terminal")
+    parser.add_argument("--script", nargs="+", metavar="FILE",
+                        help="run commands from files ('-' for stdin) without prompts or delays")
+    parser.add_argument("--format", choices=("text", "jsonl"), default="text",
+                        help="batch output: readable transcript or one JSON object per command")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the session for replay with 'python -m src.session_record play FILE'")
+    args = parser.parse_args(argv)
+
+    recorder = None
+    if args.record:
+        from src.session_record import SessionRecorder
+        recorder = SessionRecorder(args.record)
+        sys.stdout = recorder.tee(sys.stdout)
+    try:
+        if args.script:
+            sys.exit(run_scripts(args.script, args.format))
+        run_interactive(recorder)
+    finally:
+        if recorder is not None:
+            sys.stdout = sys.stdout.stream
+            recorder.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,8 +3,265 @@ import sys
 import time
 import random
 import threading
-import queue
-from typing import List, Tuple
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+class DiffRenderer:
+    """
+    Double-buffered ANSI renderer.
+
+    Each frame is a list of rows, each row a sequence of cells (strings
+    of one or more single-width characters). Only cells that differ from
+    the previous frame are redrawn, and the whole update goes out in a
+    single write.
+    """
+
+    def __init__(self, stream: TextIO = None):
+        self.stream = stream or sys.stdout
+        self._front: List[List[str]] = []
+        self.frames = 0
+        self.frame_bytes = 0  # Bytes written for the most recent frame
+        self.total_bytes = 0
+
+    def render(self, rows: Sequence[Sequence[str]]):
+        """Draw a frame, emitting only the cursor moves and cells that changed."""
+        out = []
+        if not self._front:
+            out.append("\033[?25l\033[2J")  # Hide cursor, clear once
+        front = self._front
+
+        for y, row in enumerate(rows):
+            old = front[y] if y < len(front) else ()
+            col = 0
+            run_open = False
+            for x, cell in enumerate(row):
+                if x < len(old) and old[x] == cell:
+                    run_open = False
+                else:
+                    if not run_open:
+                        out.append(f"\033[{y + 1};{col + 1}H")
+                        run_open = True
+                    out.append(cell)
+                col += len(cell)
+            if len(row) < len(old):
+                out.append(f"\033[{y + 1};{col + 1}H\033[K")
+        for y in range(len(rows), len(front)):
+            out.append(f"\033[{y + 1};1H\033[K")
+
+        self._front = [list(row) for row in rows]
+        frame = "".join(out)
+        if frame:
+            self.stream.write(frame)
+            self.stream.flush()
+        self.frames += 1
+        self.frame_bytes = len(frame.encode())
+        self.total_bytes += self.frame_bytes
+
+    def close(self):
+        """Park the cursor below the last frame and show it again."""
+        if self._front:
+            self.stream.write(f"\033[{len(self._front) + 1};1H\033[?25h")
+            self.stream.flush()
+        self._front = []
+
+# Escape sequences sent by the arrow keys (normal and application mode)
+ARROW_KEYS = {
+    '\x1b[A': 'up', '\x1b[B': 'down', '\x1b[C': 'right', '\x1b[D': 'left',
+    '\x1bOA': 'up', '\x1bOB': 'down', '\x1bOC': 'right', '\x1bOD': 'left',
+}
+
+class KeyboardReader:
+    """
+    Keyboard input for a whole game in a single raw-mode session.
+
+    The terminal is switched to raw input once on start() and restored on
+    stop(). A background thread waits on the input with selectors and
+    pushes decoded keys onto a deque, which the game loop drains without
+    locking. Arrow keys arrive as 'up', 'down', 'left' and 'right'.
+    """
+
+    ESCAPE_TIMEOUT = 0.03  # Seconds to wait for the rest of an escape sequence
+
+    def __init__(self, stream: TextIO = None):
+        self.stream = stream or sys.stdin
+        self.keys = deque()
+        self._key_ready = threading.Event()
+        self._saved_mode = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r = self._wake_w = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        import selectors
+        fd = self.stream.fileno()
+        if self.stream.isatty():
+            import termios
+            import tty
+            self._saved_mode = termios.tcgetattr(fd)
+            tty.setraw(fd)
+            # Raw input, but keep normal output processing so "\n" still works
+            mode = termios.tcgetattr(fd)
+            mode[1] |= termios.OPOST
+            termios.tcsetattr(fd, termios.TCSANOW, mode)
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._read_loop, args=(fd,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            os.write(self._wake_w, b"x")
+            self._thread.join()
+            self._thread = None
+            self._selector.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+        if self._saved_mode is not None:
+            import termios
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+
+    def _read_loop(self, fd: int):
+        pending = ""
+        while True:
+            timeout = self.ESCAPE_TIMEOUT if pending else None
+            events = self._selector.select(timeout)
+            if any(key.fd == self._wake_r for key, _ in events):
+                return
+            if events:
+                data = os.read(fd, 64)
+                if not data:
+                    return  # End of input
+                pending += data.decode(errors="ignore")
+            pending = self._decode(pending, flush=not events)
+
+    def _decode(self, text: str, flush: bool) -> str:
+        """Queue every complete key in text and return any partial escape."""
+        i = 0
+        while i < len(text):
+            if text[i] == '\x1b':
+                sequence = text[i:i + 3]
+                if sequence in ARROW_KEYS:
+                    self._push(ARROW_KEYS[sequence])
+                    i += 3
+                    continue
+                if len(sequence) < 3 and not flush:
+                    return text[i:]  # Wait for the rest of the sequence
+            self._push(text[i])
+            i += 1
+        return ""
+
+    def _push(self, key: str):
+        self.keys.append(key)
+        self._key_ready.set()
+
+    def get_key(self) -> Optional[str]:
+        """Next queued key, or None without waiting."""
+        try:
+            return self.keys.popleft()
+        except IndexError:
+            return None
+
+    def wait_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Next key, waiting up to timeout seconds (forever if None)."""
+        self._key_ready.clear()
+        key = self.get_key()
+        if key is None and self._key_ready.wait(timeout):
+            key = self.get_key()
+        return key
+
+class FrameStats:
+    """Per-phase frame timings with percentile summaries."""
+
+    PHASES = ('update', 'render', 'present')
+
+    def __init__(self, history: int = 10000):
+        # Keep only recent samples so long sessions stay bounded
+        self.samples: Dict[str, deque] = {phase: deque(maxlen=history) for phase in self.PHASES}
+        self.ticks = 0
+        self.frames = 0
+        self.dropped_ticks = 0
+
+    def record(self, phase: str, seconds: float):
+        self.samples[phase].append(seconds)
+
+    def percentiles(self, phase: str) -> Dict[str, float]:
+        """p50/p95/p99 in milliseconds for one phase."""
+        ordered = sorted(self.samples[phase])
+        if not ordered:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+        def pick(q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+        return {'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99)}
+
+    def report(self) -> str:
+        lines = [f"ticks={self.ticks} frames={self.frames} dropped_ticks={self.dropped_ticks}"]
+        for phase in self.PHASES:
+            p = self.percentiles(phase)
+            lines.append(f"{phase:<8} p50 {p['p50']:7.3f} ms  p95 {p['p95']:7.3f} ms  p99 {p['p99']:7.3f} ms")
+        return "\n".join(lines)
+
+class GameClock:
+    """
+    Fixed-timestep game loop on the monotonic clock.
+
+    The simulation advances in fixed ticks regardless of how long
+    rendering takes. A late loop catches up with extra ticks, up to
+    max_catch_up, and drops the rest of the backlog rather than
+    spiralling. A frame is rendered and presented once after each batch
+    of ticks.
+    """
+
+    def __init__(self, tick_rate: float = 5.0, max_catch_up: int = 5):
+        self.tick = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.stats = FrameStats()
+
+    def _timed(self, phase: str, func: Callable, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.stats.record(phase, time.perf_counter() - start)
+        return result
+
+    def _draw(self, render: Callable, present: Callable):
+        frame = self._timed('render', render)
+        self._timed('present', present, frame)
+        self.stats.frames += 1
+
+    def run(self, update: Callable[[], None], render: Callable[[], object],
+            present: Callable[[object], None], running: Callable[[], bool]):
+        """Loop until running() is false: update on ticks, then draw."""
+        self._draw(render, present)
+        next_tick = time.monotonic() + self.tick
+        while running():
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+
+            updates = 0
+            now = time.monotonic()
+            while now >= next_tick and updates < self.max_catch_up and running():
+                self._timed('update', update)
+                self.stats.ticks += 1
+                next_tick += self.tick
+                updates += 1
+            if now >= next_tick:
+                # Too far behind: skip the backlog instead of chasing it
+                behind = int((now - next_tick) / self.tick) + 1
+                self.stats.dropped_ticks += behind
+                next_tick += behind * self.tick
+
+            if updates:
+                self._draw(render, present)
 
 class SnakeGame:
     def __init__(self, width: int = 20, height: int = 10):
@@ -15,7 +272,8 @@ class SnakeGame:
         self.food = self._spawn_food()
         self.score = 0
         self.game_over = False
-        self._input_queue = queue.Queue()
+        self.keyboard = KeyboardReader()
+        self.renderer = DiffRenderer()
 
     def _spawn_food(self) -> Tuple[int, int]:
         """Spawn food at a random location not occupied by the snake."""
@@ -25,49 +283,13 @@ class SnakeGame:
             if food not in self.snake:
                 return food
 
-    def _get_input(self):
-        """Get keyboard input without blocking."""
-        while not self.game_over:
-            try:
-                if sys.stdin.isatty():
-                    import termios
-                    import tty
-                    import select
-
-                    # Save the terminal settings
-                    old_settings = termios.tcgetattr(sys.stdin)
-                    try:
-                        # Set the terminal to raw mode
-                        tty.setraw(sys.stdin.fileno())
-
-                        if select.select([sys.stdin], [], [], 0.1)[0]:
-                            key = sys.stdin.read(1)
-                            if key == '\x03':  # Ctrl+C
-                                self.game_over = True
-                                break
-                            self._input_queue.put(key)
-                    finally:
-                        # Restore terminal settings
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            except Exception:
-                time.sleep(0.1)
-                continue
-
     def start(self):
         """Start the game."""
         try:
-            # Start input thread
-            input_thread = threading.Thread(target=self._get_input)
-            input_thread.daemon = True
-            input_thread.start()
-
-            self._game_loop()
+            with self.keyboard:
+                self._game_loop()
         except KeyboardInterrupt:
             self.game_over = True
-        finally:
-            if os.name != 'nt':
-                # Restore terminal
-                os.system('stty sane')
 
     def _game_loop(self):
         """Main game loop."""
@@ -76,12 +298,15 @@ class SnakeGame:
             self._draw()
 
             # Handle input
-            try:
-                while not self._input_queue.empty():
-                    key = self._input_queue.get_nowait()
-                    self._handle_input(key)
-            except queue.Empty:
-                pass
+            key = self.keyboard.get_key()
+            while key is not None:
+                if key == '\x03':  # Ctrl+C
+                    self.game_over = True
+                    break
+                self._handle_input(key)
+                key = self.keyboard.get_key()
+            if self.game_over:
+                break
 
             # Move snake
             new_head = (
@@ -106,6 +331,7 @@ class SnakeGame:
             time.sleep(0.2)  # Game speed
 
         # Game over screen
+        self.renderer.close()
         os.system('cls' if os.name == 'nt' else 'clear')
         print(f"\nGame Over! Score: {self.score}")
 
@@ -121,6 +347,10 @@ class SnakeGame:
             'A': (-1, 0),   # Left
             'S': (0, 1),    # Down
             'D': (1, 0),    # Right
+            'up': (0, -1),
+            'left': (-1, 0),
+            'down': (0, 1),
+            'right': (1, 0),
         }
 
         if key in directions:
@@ -132,70 +362,130 @@ class SnakeGame:
 
     def _draw(self):
         """Draw the game board."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Paint the board, then frame it
+        board = [['  '] * self.width for _ in range(self.height)]
+        fx, fy = self.food
+        board[fy][fx] = '◆ '  # Food
+        for x, y in self.snake:
+            board[y][x] = '██'  # Snake
 
-        # Draw top border
-        print('╔' + '═' * (self.width * 2) + '╗')
-
-        for y in range(self.height):
-            print('║', end='')
-            for x in range(self.width):
-                pos = (x, y)
-                if pos == self.snake[0]:
-                    print('██', end='')  # Snake head
-                elif pos in self.snake:
-                    print('██', end='')  # Snake body
-                elif pos == self.food:
-                    print('◆ ', end='')  # Food
-                else:
-                    print('  ', end='')  # Empty space
-            print('║')
-
-        # Draw bottom border
-        print('╚' + '═' * (self.width * 2) + '╝')
-        print(f'\nScore: {self.score}')
-        print('\nUse WASD to move, Ctrl+C to exit')
+        rows = [list('╔' + '═' * (self.width * 2) + '╗')]
+        rows.extend(['║'] + line + ['║'] for line in board)
+        rows.append(list('╚' + '═' * (self.width * 2) + '╝'))
+        rows.append([])
+        rows.append(list(f'Score: {self.score}'))
+        rows.append([])
+        rows.append(list('Use WASD to move, Ctrl+C to exit'))
+        self.renderer.render(rows)
 import os
 import time
 import random
 import sys
-import select
-import termios
-import tty
+from collections import deque
+
+class CellIndex:
+    """Set of board cells with O(1) add, remove and uniform random choice."""
+
+    def __init__(self, cells):
+        self._cells = list(cells)
+        self._slot = {cell: i for i, cell in enumerate(self._cells)}
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, cell):
+        return cell in self._slot
+
+    def add(self, cell):
+        if cell not in self._slot:
+            self._slot[cell] = len(self._cells)
+            self._cells.append(cell)
+
+    def remove(self, cell):
+        # Fill the hole with the last cell so the list stays dense
+        i = self._slot.pop(cell)
+        last = self._cells.pop()
+        if last != cell:
+            self._cells[i] = last
+            self._slot[last] = i
+
+    def choice(self, rng=random):
+        return rng.choice(self._cells)
 
 class SnakeGame:
-    def __init__(self, width=20, height=10):
+    # Arrow keys and Ctrl+C behave like their WASD/Q equivalents
+    KEY_ALIASES = {'up': 'w', 'down': 's', 'left': 'a', 'right': 'd', '\x03': 'q'}
+
+    def __init__(self, width=20, height=10, seed=None):
         self.width = width
         self.height = height
-        self.snake = [(width // 2, height // 2)]
+        # Seeded games are reproducible; otherwise share the global generator
+        self.rng = random.Random(seed) if seed is not None else random
+        self.renderer = DiffRenderer()
+        self.keyboard = KeyboardReader()
+        self.clock = GameClock(tick_rate=5)  # Same pace as the old 0.2s sleep
+        self.reset()
+
+    def reset(self):
+        """Start a new game on the same board and return its state."""
+        width, height = self.width, self.height
+        self.snake = deque([(width // 2, height // 2)])
+        self.occupied = set(self.snake)  # Cells covered by the snake
+        self.free = CellIndex((x, y) for y in range(height) for x in range(width)
+                              if (x, y) not in self.occupied)
         self.direction = (1, 0)  # (x, y) Right direction initially
         self.food = self._place_food()
         self.score = 0
         self.game_over = False
+        return self.state()
+
+    def state(self):
+        """Snapshot of the game for agents and tests."""
+        return {
+            'snake': tuple(self.snake),
+            'food': self.food,
+            'direction': self.direction,
+            'score': self.score,
+            'width': self.width,
+            'height': self.height,
+        }
+
+    def step(self, action=None):
+        """
+        Advance one tick without touching the terminal.
+
+        Args:
+            action: A key as accepted from the keyboard ('w', 'a', 's', 'd',
+                'q') or None to keep going straight
+
+        Returns:
+            (state, reward, done): reward is 1 for eating, -1 for dying
+            and 0 otherwise, including for quitting and once the game is over
+        """
+        if self.game_over:
+            return self.state(), 0, True
+        if action:
+            self._update_direction(action)
+        if self.game_over:  # Quit
+            return self.state(), 0, True
+        score = self.score
+        self._move_snake()
+        if self.game_over and self.food is not None:
+            reward = -1
+        else:
+            reward = self.score - score
+        return self.state(), reward, self.game_over
         
     def _place_food(self):
         """Place food at a random position not occupied by the snake."""
-        while True:
-            food = (random.randint(0, self.width - 1), random.randint(0, self.height - 1))
-            if food not in self.snake:
-                return food
+        # The free-cell index makes this O(1) however full the board is
+        if not self.free:
+            return None  # The snake fills the board
+        return self.free.choice(self.rng)
                 
-    def _get_key(self, timeout=0.1):
-        """Get a keypress without waiting for enter."""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            rlist, _, _ = select.select([sys.stdin], [], [], timeout)
-            if rlist:
-                return sys.stdin.read(1)
-            else:
-                return None
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            
     def _update_direction(self, key):
         """Update the snake's direction based on keyboard input."""
+        key = self.KEY_ALIASES.get(key, key)
         if key == 'w' and self.direction != (0, 1):  # Up
             self.direction = (0, -1)
         elif key == 's' and self.direction != (0, -1):  # Down
@@ -207,6 +497,15 @@ class SnakeGame:
         elif key == 'q':  # Quit
             self.game_over = True
             
+    def _handle_keys(self):
+        """Apply queued keys until one changes direction, keeping the rest."""
+        direction = self.direction
+        while self.direction == direction and not self.game_over:
+            key = self.keyboard.get_key()
+            if key is None:
+                return
+            self._update_direction(key)
+
     def _move_snake(self):
         """Move the snake in its current direction."""
         head_x, head_y = self.snake[0]
@@ -214,59 +513,67 @@ class SnakeGame:
         new_head = ((head_x + dx) % self.width, (head_y + dy) % self.height)
         
         # Check if snake hits itself
-        if new_head in self.snake:
+        if new_head in self.occupied:
             self.game_over = True
             return
             
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.occupied.add(new_head)
+        self.free.remove(new_head)
         
         # Check if snake eats food
         if new_head == self.food:
             self.score += 1
             self.food = self._place_food()
+            if self.food is None:
+                self.game_over = True  # Board full: nothing left to eat
         else:
-            self.snake.pop()
+            tail = self.snake.pop()
+            self.occupied.discard(tail)
+            self.free.add(tail)
             
     def _draw_game(self):
         """Draw the current game state."""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-        # Draw top border
-        print("+" + "-" * self.width + "+")
-        
-        # Draw game area
-        for y in range(self.height):
-            line = "|"
-            for x in range(self.width):
-                if (x, y) == self.snake[0]:
-                    line += "O"  # Snake head
-                elif (x, y) in self.snake[1:]:
-                    line += "o"  # Snake body
-                elif (x, y) == self.food:
-                    line += "X"  # Food
-                else:
-                    line += " "  # Empty space
-            line += "|"
-            print(line)
-            
-        # Draw bottom border
-        print("+" + "-" * self.width + "+")
-        print(f"Score: {self.score} | Use WASD to move, Q to quit")
+        self.renderer.render(self._render_frame())
+
+    def _render_frame(self):
+        """Build the rows of the current frame without drawing them."""
+        # Paint the game area: food, body, then head on top
+        board = [[" "] * self.width for _ in range(self.height)]
+        if self.food is not None:
+            fx, fy = self.food
+            board[fy][fx] = "X"  # Food
+        for x, y in self.snake:
+            board[y][x] = "o"  # Snake body
+        hx, hy = self.snake[0]
+        board[hy][hx] = "O"  # Snake head
+
+        border = list("+" + "-" * self.width + "+")
+        rows = [border]
+        rows.extend(["|"] + line + ["|"] for line in board)
+        rows.append(border)
+        rows.append(list(f"Score: {self.score} | Use WASD to move, Q to quit"))
+        return rows
+
+    def _tick(self):
+        """One fixed simulation step: apply input, then move."""
+        self._handle_keys()
+        if not self.game_over:
+            self._move_snake()
         
     def start(self):
         """Start the game loop."""
         try:
-            while not self.game_over:
-                self._draw_game()
-                key = self._get_key(0.1)
-                if key:
-                    self._update_direction(key)
-                self._move_snake()
-                time.sleep(0.1)
-                
-            print(f"\nGame Over! Final Score: {self.score}")
-            print("Press any key to exit...")
-            self._get_key()
+            with self.keyboard:
+                self.clock.run(self._tick, self._render_frame, self.renderer.render,
+                               lambda: not self.game_over)
+
+                self.renderer.close()
+                print(f"\nGame Over! Final Score: {self.score}")
+                if os.environ.get('VOIDBORN_FRAME_STATS'):
+                    print(self.clock.stats.report())
+                print("Press any key to exit...")
+                self.keyboard.wait_key()
             
         except Exception as e:
             print(f"Game error: {str(e)}")
@@ -0,0 +1,155 @@
+"""
+Command registry shared by the home terminal and the remote server.
+
+A shell class declares a registry and decorates its handler methods; the
+table is built once, when the class body runs, and every line is then
+one dict lookup away from its handler:
+
+    class Shell:
+        commands = CommandRegistry()
+
+        @commands.command('pwd', "Print working directory", aliases=('cwd',))
+        def _pwd(self, args):
+            return self.current_path
+
+A subclass that overrides a decorated method gets its override
+dispatched, as with any method call. Plugins extend a shell the same way
+from outside, with a plain function taking the shell instance:
+
+    @RemoteServer.commands.command('uptime', "Show how long the server has run")
+    def uptime(server, args):
+        return "up 6 days, 6:06"
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from .completion import PrefixTrie
+
+Handler = Callable[[Any, List[str]], Optional[str]]
+
+
+class Command:
+    """One registered command: its handler, help line and argument bounds."""
+
+    __slots__ = ('name', 'handler', 'help', 'usage', 'aliases', 'min_args', 'max_args')
+
+    def __init__(self, name: str, handler: Handler, help: str, usage: Optional[str] = None,
+                 aliases: Iterable[str] = (), min_args: int = 0, max_args: Optional[int] = None):
+        self.name = name
+        self.handler = handler
+        self.help = help
+        self.usage = usage or name
+        self.aliases = tuple(aliases)
+        self.min_args = min_args
+        self.max_args = max_args
+
+    def accepts(self, args: List[str]) -> bool:
+        return len(args) >= self.min_args and (self.max_args is None or len(args) <= self.max_args)
+
+
+class CommandRegistry:
+    """
+    Commands by name and alias, in registration order.
+
+    Args:
+        help_width: Column the help descriptions start at
+        usage_error: Message for a wrong argument count; {usage} is filled in
+    """
+
+    def __init__(self, help_width: int = 8, usage_error: str = "Usage: {usage}"):
+        self.help_width = help_width
+        self.usage_error = usage_error
+        self.commands: Dict[str, Command] = {}
+        self._lookup: Dict[str, Command] = {}  # Names and aliases
+        self._names = PrefixTrie()  # Names and aliases, for completion
+        self._help: Optional[str] = None  # Rendered help, rebuilt after changes
+        # (shell class, command name) -> handler after subclass overrides
+        self._resolved: Dict[Tuple[type, str], Handler] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._lookup
+
+    def __len__(self):
+        return len(self.commands)
+
+    def command(self, name: str, help: str, usage: Optional[str] = None,
+                aliases: Iterable[str] = (), min_args: int = 0,
+                max_args: Optional[int] = None) -> Callable[[Handler], Handler]:
+        """Decorator registering a handler(shell, args) under name."""
+        def decorator(handler: Handler) -> Handler:
+            self.register(Command(name, handler, help, usage, aliases, min_args, max_args))
+            return handler
+        return decorator
+
+    def register(self, command: Command, replace: bool = False):
+        """Add a command; replace=True lets a plugin override an existing one."""
+        names = (command.name,) + command.aliases
+        taken = [name for name in names if name in self._lookup]
+        if taken and not replace:
+            raise ValueError(f"Command already registered: {', '.join(taken)}")
+        if command.name in self.commands:
+            self.unregister(command.name)
+        self.commands[command.name] = command
+        for name in names:
+            self._lookup[name] = command
+            self._names.insert(name)
+        self._help = None
+        self._resolved.clear()
+
+    def unregister(self, name: str):
+        command = self.commands.pop(name)
+        for alias in (name,) + command.aliases:
+            if self._lookup.get(alias) is command:
+                del self._lookup[alias]
+                self._names.remove(alias)
+        self._help = None
+        self._resolved.clear()
+
+    def get(self, name: str) -> Optional[Command]:
+        return self._lookup.get(name)
+
+    def complete(self, prefix: str) -> List[str]:
+        """Command names and aliases starting with prefix."""
+        return self._names.complete(prefix.lower())
+
+    def copy(self) -> "CommandRegistry":
+        """An independent registry with the same commands, for subclasses."""
+        registry = CommandRegistry(self.help_width, self.usage_error)
+        for command in self.commands.values():
+            registry.register(command)
+        return registry
+
+    def dispatch(self, shell: Any, name: str, args: List[str]) -> Optional[str]:
+        """Run a command on shell. Raises KeyError for unknown names."""
+        command = self._lookup[name]
+        if not command.accepts(args):
+            return self.usage_error.format(usage=command.usage)
+        return self._resolve(type(shell), command)(shell, args)
+
+    def _resolve(self, cls: type, command: Command) -> Handler:
+        """The handler for shells of class cls, honouring overridden methods."""
+        key = (cls, command.name)
+        handler = self._resolved.get(key)
+        if handler is None:
+            handler = command.handler
+            name = getattr(handler, '__name__', None)
+            # Only methods of the shell's classes; plugin functions stay as given
+            if name and any(klass.__dict__.get(name) is handler for klass in cls.__mro__):
+                handler = getattr(cls, name)
+            self._resolved[key] = handler
+        return handler
+
+    def help_text(self, name: Optional[str] = None) -> str:
+        """The command list, or usage and aliases for one command."""
+        if name is not None:
+            command = self.get(name.lower())
+            if command is None:
+                return f"help: no such command: {name}"
+            lines = [f"{command.name} - {command.help}", f"Usage: {command.usage}"]
+            if command.aliases:
+                lines.append(f"Aliases: {', '.join(command.aliases)}")
+            return "\n".join(lines)
+
+        if self._help is None:
+            self._help = "Available commands:\n" + "\n".join(
+                f"{command.name.ljust(self.help_width - 1)} - {command.help}"
+                for command in self.commands.values())
+        return self._help
@@ -0,0 +1,130 @@
+"""
+Tab completion for the interactive shells.
+
+Shells expose complete(line) -> candidates for the text before the
+cursor; install_completion() wires that into readline where available.
+"""
+import bisect
+from typing import Dict, List, Optional, Sequence
+
+
+class _TrieNode:
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terminal = False
+
+
+class PrefixTrie:
+    """Set of words supporting incremental insert/remove and prefix lookup."""
+
+    def __init__(self, words: Sequence[str] = ()):
+        self.root = _TrieNode()
+        self.size = 0
+        for word in words:
+            self.insert(word)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and node.terminal
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, word: str):
+        node = self.root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+
+    def remove(self, word: str):
+        """Remove word if present, pruning branches left empty."""
+        path = [self.root]
+        for char in word:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        if not path[-1].terminal:
+            return
+        path[-1].terminal = False
+        self.size -= 1
+        for i in range(len(word), 0, -1):
+            node = path[i]
+            if node.terminal or node.children:
+                break
+            del path[i - 1].children[word[i - 1]]
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Sorted words starting with prefix (at most limit of them)."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        found: List[str] = []
+        stack = [(prefix, node)]
+        while stack and (limit is None or len(found) < limit):
+            word, node = stack.pop()
+            if node.terminal:
+                found.append(word)
+            # Push in reverse so the smallest child is visited first
+            for char in sorted(node.children, reverse=True):
+                stack.append((word + char, node.children[char]))
+        return found
+
+
+def complete_sorted(names: List[str], prefix: str) -> List[str]:
+    """Names starting with prefix, from an already sorted list."""
+    start = bisect.bisect_left(names, prefix)
+    # Every name with the prefix sorts before prefix + the highest code point
+    end = bisect.bisect_left(names, prefix + "\U0010ffff", start)
+    return names[start:end]
+
+
+def split_line(line: str):
+    """(preceding words, word being completed) for the text before the cursor."""
+    words = line.split()
+    if not words or line[-1:].isspace():
+        return words, ""
+    return words[:-1], words[-1]
+
+
+def install_completion(shell) -> bool:
+    """
+    Complete with Tab at input() prompts using shell.complete(line).
+    Returns False when readline is not available (e.g. on Windows).
+    """
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    matches: List[str] = []
+
+    def completer(text: str, state: int) -> Optional[str]:
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            matches[:] = shell.complete(line)
+        return matches[state] if state < len(matches) else None
+
+    # Only whitespace separates words, so whole paths complete at once
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(completer)
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    return True
@@ -1,17 +1,329 @@
 
 import hashlib
+import hmac
 import base64
+import json
 import os
-from cryptography.fernet import Fernet
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Tuple, Union
+from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# In a real application, this would be stored securely
+GAME_PASSWORD = b'voidborn_secure_password'
+GAME_SALT = b'game_salt_fixed'
+KDF_ITERATIONS = 100000
+KDF_ALGORITHM = 'sha256'
+
+# Version byte at the start of every compact ciphertext envelope
+FORMAT_FERNET = 0x01  # version + raw Fernet token
+FORMAT_AESGCM = 0x02  # version + 12-byte nonce + AES-GCM ciphertext/tag
+CIPHER_MODES = {'fernet': FORMAT_FERNET, 'aesgcm': FORMAT_AESGCM}
+
+# Plaintext bytes per frame when streaming large payloads
+STREAM_CHUNK_SIZE = 64 * 1024
+# Stream header: format byte + random stream id + chunk size. Each frame's
+# counter and final flag are bound into its encryption, so frames cannot be
+# dropped, reordered, replayed from another stream or cut off at the end
+# unnoticed
+STREAM_ID_SIZE = 7
+STREAM_HEADER_SIZE = 1 + STREAM_ID_SIZE + 4
+STREAM_MAX_CHUNK_SIZE = 16 * 1024 * 1024
+# Most a frame's ciphertext exceeds its chunk by: the AES-GCM tag, or
+# Fernet's version, timestamp, IV, padding, HMAC and 24-byte position prefix
+STREAM_FRAME_OVERHEAD = 128
+STREAM_FINAL = 0x80000000  # Final-frame flag in the 4-byte frame length
+
+# Digests computed by hash_stream / generate_multiple_hashes
+HASH_ALGORITHMS = ('md5', 'sha1', 'sha256', 'sha512')
+HASH_CHUNK_SIZE = 1024 * 1024
+# Inputs past this many bytes update the digests on parallel threads
+HASH_PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+# Password hashing: salt size and PBKDF2 rounds for stored password hashes
+PASSWORD_SALT_SIZE = 16
+PASSWORD_ITERATIONS = 100000
+# Worker threads for off-thread hashing (pbkdf2_hmac releases the GIL)
+PASSWORD_WORKERS = os.cpu_count() or 4
+
+# Login throttling: failures allowed per user before a lockout, and the
+# lockout length in seconds, doubled for every further failure
+AUTH_MAX_FAILURES = 5
+AUTH_LOCKOUT = 2.0
+AUTH_MAX_LOCKOUT = 300.0
+# Most users tracked at once; idle entries are forgotten AUTH_MAX_LOCKOUT
+# seconds after their last failure or lockout, or sooner (oldest first)
+# when the table is full and they are not locked out
+AUTH_MAX_TRACKED = 10000
+
+# Derived keys shared by every CryptoOperations in the process, keyed by
+# (password, salt, iterations, algorithm). _key_cache_lock only guards the
+# dicts; each key has its own lock held while it is derived, so deriving
+# one key never holds up lookups or derivations of another
+_key_cache: Dict[Tuple[bytes, bytes, int, str], bytes] = {}
+_key_locks: Dict[Tuple[bytes, bytes, int, str], threading.Lock] = {}
+_key_cache_lock = threading.Lock()
+_cache_file_lock = threading.Lock()  # Serialises read-modify-write of cache files
+
+
+def _cache_file_id(cache_key: Tuple[bytes, bytes, int, str]) -> str:
+    """Identify a cache entry on disk without writing the password out."""
+    password, salt, iterations, algorithm = cache_key
+    digest = hashlib.sha256()
+    for part in (password, salt, str(iterations).encode(), algorithm.encode()):
+        digest.update(len(part).to_bytes(4, 'big') + part)
+    return digest.hexdigest()
+
+
+def _load_cache_file(cache_file: str) -> Dict[str, str]:
+    try:
+        with open(cache_file, 'r') as f:
+            entries = json.load(f)
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache_file(cache_file: str, file_id: str, key: bytes):
+    """
+    Add a key to the cache file. The file holds derived keys in the clear,
+    so it is created readable and writable by the owner only (0600).
+    """
+    with _cache_file_lock:
+        entries = _load_cache_file(cache_file)
+        entries[file_id] = key.decode()
+        tmp_path = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            pass  # The cache file is only an optimisation
+
+
+def derive_key(password: bytes = GAME_PASSWORD, salt: bytes = GAME_SALT,
+               iterations: int = KDF_ITERATIONS, algorithm: str = KDF_ALGORITHM,
+               cache_file: Optional[str] = None) -> bytes:
+    """
+    Derive a Fernet key with PBKDF2, paying the cost once per process.
+
+    Args:
+        password: Secret to derive the key from
+        salt: KDF salt
+        iterations: PBKDF2 iteration count
+        algorithm: Name of the hash algorithm (e.g. 'sha256')
+        cache_file: Optional JSON file used to persist keys across sessions.
+            It stores the derived keys themselves, so treat it as secret:
+            anyone who can read it can decrypt without the password
+    """
+    cache_key = (password, salt, iterations, algorithm)
+    key = _key_cache.get(cache_key)
+    if key is not None:
+        return key
+
+    with _key_cache_lock:
+        key_lock = _key_locks.setdefault(cache_key, threading.Lock())
+    with key_lock:
+        # Another thread may have derived it while we waited
+        key = _key_cache.get(cache_key)
+        if key is not None:
+            return key
+
+        file_id = _cache_file_id(cache_key) if cache_file else None
+        if file_id:
+            stored = _load_cache_file(cache_file).get(file_id)
+            if stored:
+                key = stored.encode()
+
+        if key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=getattr(hashes, algorithm.upper())(),
+                length=32,
+                salt=salt,
+                iterations=iterations,
+            )
+            key = base64.urlsafe_b64encode(kdf.derive(password))
+            if file_id:
+                _store_cache_file(cache_file, file_id, key)
+
+        with _key_cache_lock:
+            _key_cache[cache_key] = key
+            # Threads still waiting hold the lock object and find the key
+            _key_locks.pop(cache_key, None)
+        return key
+
+
+@lru_cache(maxsize=32)
+def _fernet_for(key: bytes) -> Fernet:
+    """Reuse Fernet instances for keys passed in by callers."""
+    return Fernet(key)
+
+
+def clear_key_cache():
+    """Forget every derived key held in memory."""
+    with _key_cache_lock:
+        _key_cache.clear()
+
+
+_password_pool: Optional[ThreadPoolExecutor] = None
+_password_pool_lock = threading.Lock()
+_login_throttle: Optional["LoginThrottle"] = None
+
+
+def password_pool() -> ThreadPoolExecutor:
+    """The process-wide thread pool that runs password hashing."""
+    global _password_pool
+    if _password_pool is None:
+        with _password_pool_lock:
+            if _password_pool is None:
+                _password_pool = ThreadPoolExecutor(
+                    max_workers=PASSWORD_WORKERS, thread_name_prefix='password')
+    return _password_pool
+
+
+def login_throttle() -> "LoginThrottle":
+    """The process-wide login throttle, so a new session is no way around a lockout."""
+    global _login_throttle
+    if _login_throttle is None:
+        with _password_pool_lock:
+            if _login_throttle is None:
+                _login_throttle = LoginThrottle()
+    return _login_throttle
+
+
+def _hash_attempt(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PASSWORD_ITERATIONS)
+
+
+class LoginThrottle:
+    """
+    Per-user failed attempt tracking with exponential lockouts.
+
+    A user may fail AUTH_MAX_FAILURES times; after that each failure locks
+    them out for AUTH_LOCKOUT seconds, doubling up to AUTH_MAX_LOCKOUT.
+    A successful login resets the count. Attempts are reserved with
+    acquire() before hashing and count as failures until release(), so
+    concurrent guesses cannot run past the limit.
+    """
+
+    def __init__(self, max_failures: int = AUTH_MAX_FAILURES,
+                 lockout: float = AUTH_LOCKOUT, max_lockout: float = AUTH_MAX_LOCKOUT,
+                 max_tracked: int = AUTH_MAX_TRACKED):
+        self.max_failures = max_failures
+        self.lockout = lockout
+        self.max_lockout = max_lockout
+        self.max_tracked = max_tracked
+        # user -> [failures, monotonic time the lockout ends, attempts in flight,
+        # monotonic time of the last change]; least recently changed first
+        self._users: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._users)
+
+    def retry_after(self, user: str) -> float:
+        """Seconds until user may try again (0 if not locked out)."""
+        with self._lock:
+            entry = self._users.get(user)
+        return max(0.0, entry[1] - time.monotonic()) if entry else 0.0
+
+    def acquire(self, user: str) -> bool:
+        """Reserve an attempt for user; False if they must wait."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(user)
+            if entry is None:
+                if len(self._users) >= self.max_tracked:
+                    self._evict(now)
+                    if len(self._users) >= self.max_tracked:
+                        return False  # Full of lockouts and attempts in flight
+                entry = self._users[user] = [0, 0.0, 0, now]
+            failures, locked_until, in_flight, _ = entry
+            if now < locked_until:
+                return False
+            # Past the limit, one attempt at a time once a lockout has passed
+            allowed = max(1, self.max_failures - int(failures))
+            if in_flight >= allowed:
+                return False
+            entry[2] += 1
+            return True
+
+    def release(self, user: str, success: Optional[bool]):
+        """Settle an attempt reserved with acquire(); None if it never ran."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.pop(user, None)
+            if entry is None:
+                return
+            entry[2] -= 1
+            if success:
+                entry[0], entry[1] = 0, 0.0
+            elif success is not None:
+                entry[0] += 1
+                if entry[0] >= self.max_failures:
+                    delay = self.lockout * 2 ** (entry[0] - self.max_failures)
+                    entry[1] = now + min(delay, self.max_lockout)
+            entry[3] = now
+            if entry[0] or entry[2]:
+                self._users[user] = entry  # Re-inserted as most recent
+
+    def _evict(self, now: float):
+        """
+        Forget idle entries; if still full, the least recently changed that
+        are neither locked out nor mid-attempt. Lockouts are never dropped
+        early, so flooding the table with new names cannot lift one.
+        """
+        for user, (failures, locked_until, in_flight, changed) in list(self._users.items()):
+            if not in_flight and now >= max(locked_until, changed) + self.max_lockout:
+                del self._users[user]
+        for user, (failures, locked_until, in_flight, changed) in list(self._users.items()):
+            if len(self._users) < self.max_tracked:
+                break
+            if not in_flight and now >= locked_until:
+                del self._users[user]
+
 
 class CryptoOperations:
-    def __init__(self):
-        self.key = self._generate_key()
-        self.cipher = Fernet(self.key)
-        
+    def __init__(self, key_cache_file: Optional[str] = None, mode: str = 'fernet'):
+        if mode not in CIPHER_MODES:
+            raise ValueError(f"Unknown cipher mode: {mode}")
+        self.mode = mode
+        # The key is derived lazily on first encrypt/decrypt
+        self.key_cache_file = key_cache_file or os.environ.get('VOIDBORN_KEY_CACHE')
+        self._key: Optional[bytes] = None
+        self._cipher: Optional[Fernet] = None
+        self._aead: Optional[AESGCM] = None
+        self.throttle = login_throttle()
+
+    @property
+    def key(self) -> bytes:
+        if self._key is None:
+            self._key = self._generate_key()
+        return self._key
+
+    @property
+    def cipher(self) -> Fernet:
+        if self._cipher is None:
+            self._cipher = Fernet(self.key)
+        return self._cipher
+
+    @property
+    def aead(self) -> AESGCM:
+        if self._aead is None:
+            # Separate subkey so Fernet and AES-GCM never share key material
+            hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                        info=b'voidborn-aesgcm')
+            self._aead = AESGCM(hkdf.derive(base64.urlsafe_b64decode(self.key)))
+        return self._aead
+
     @staticmethod
     def generate_key() -> bytes:
         """Generate a new Fernet encryption key."""
@@ -19,44 +331,164 @@ class CryptoOperations:
         
     def _generate_key(self):
         """Generate a secure key for encryption/decryption."""
-        # In a real application, this would be stored securely
-        salt = b'game_salt_fixed'
-        password = b'voidborn_secure_password'
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
-        return key
+        return derive_key(cache_file=self.key_cache_file)
     
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Encrypt bytes into a compact binary envelope (version byte first)."""
+        if self.mode == 'aesgcm':
+            nonce = os.urandom(12)
+            return bytes([FORMAT_AESGCM]) + nonce + self.aead.encrypt(nonce, data, None)
+        token = base64.urlsafe_b64decode(self.cipher.encrypt(data))
+        return bytes([FORMAT_FERNET]) + token
+
+    def decrypt_bytes(self, envelope: bytes) -> bytes:
+        """Decrypt a binary envelope produced by encrypt_bytes."""
+        version = envelope[0]
+        if version == FORMAT_AESGCM:
+            return self.aead.decrypt(envelope[1:13], envelope[13:], None)
+        if version == FORMAT_FERNET:
+            # Fernet only accepts base64 tokens, so this mode still pays one
+            # encode here (but no longer a second decode); AES-GCM pays none
+            return self.cipher.decrypt(base64.urlsafe_b64encode(envelope[1:]))
+        raise ValueError(f"Unknown ciphertext format: {version:#x}")
+
     def encrypt(self, data: str) -> str:
         """Encrypt a string and return the encrypted string."""
         if not data:
             return ""
-        encrypted = self.cipher.encrypt(data.encode())
-        return base64.urlsafe_b64encode(encrypted).decode()
+        return base64.urlsafe_b64encode(self.encrypt_bytes(data.encode())).decode()
         
     def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt an encrypted string."""
+        """Decrypt an encrypted string (compact or legacy double-base64 format)."""
         if not encrypted_data:
             return ""
         try:
             data = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted = self.cipher.decrypt(data)
-            return decrypted.decode()
+            if data[0] in (FORMAT_FERNET, FORMAT_AESGCM):
+                return self.decrypt_bytes(data).decode()
+            # Legacy format: base64 of a Fernet token
+            return self.cipher.decrypt(data).decode()
         except Exception:
             return "[Decryption failed - Invalid data or key]"
-    
+
+    def encrypt_many(self, items: Iterable[str], max_workers: Optional[int] = None) -> List[str]:
+        """Encrypt many strings across a thread pool, preserving order."""
+        self.cipher  # Derive the key once before fanning out
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.encrypt, items))
+
+    def decrypt_many(self, items: Iterable[str], max_workers: Optional[int] = None) -> List[str]:
+        """Decrypt many strings across a thread pool, preserving order."""
+        self.cipher
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.decrypt, items))
+
+    @staticmethod
+    def _frame_nonce(stream_id: bytes, counter: int, final: bool) -> bytes:
+        """12 bytes unique to one frame position in one stream."""
+        return stream_id + counter.to_bytes(4, 'big') + bytes([final])
+
+    def _seal_frame(self, header: bytes, counter: int, final: bool, chunk: bytes) -> bytes:
+        nonce = self._frame_nonce(header[1:1 + STREAM_ID_SIZE], counter, final)
+        if header[0] == FORMAT_AESGCM:
+            return self.aead.encrypt(nonce, chunk, header)
+        # Fernet takes no associated data, so position and header ride inside the token
+        return base64.urlsafe_b64decode(self.cipher.encrypt(nonce + header + chunk))
+
+    def _open_frame(self, header: bytes, counter: int, final: bool, frame: bytes) -> bytes:
+        nonce = self._frame_nonce(header[1:1 + STREAM_ID_SIZE], counter, final)
+        try:
+            if header[0] == FORMAT_AESGCM:
+                return self.aead.decrypt(nonce, frame, header)
+            chunk = self.cipher.decrypt(base64.urlsafe_b64encode(frame))
+        except (InvalidTag, InvalidToken):
+            raise ValueError(f"Corrupted encrypted stream (frame {counter})") from None
+        prefix = nonce + header
+        if chunk[:len(prefix)] != prefix:
+            raise ValueError(f"Encrypted stream frames out of order (frame {counter})")
+        return chunk[len(prefix):]
+
+    def encrypt_stream(self, source: BinaryIO, dest: BinaryIO,
+                       chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        """
+        Encrypt a binary stream chunk by chunk in the current cipher mode.
+
+        The output is a header (format byte, random stream id, 4-byte chunk
+        size) followed by frames, each a 4-byte big-endian length and the
+        raw ciphertext; the top bit of the length marks the last frame.
+        Only one chunk (plus one read ahead, to spot the last) is held in
+        memory. Returns the number of plaintext bytes read.
+        """
+        if not 0 < chunk_size <= STREAM_MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {STREAM_MAX_CHUNK_SIZE}")
+        header = (bytes([CIPHER_MODES[self.mode]]) + os.urandom(STREAM_ID_SIZE)
+                  + chunk_size.to_bytes(4, 'big'))
+        dest.write(header)
+        total = 0
+        counter = 0
+        chunk = source.read(chunk_size)
+        while True:
+            following = source.read(chunk_size) if chunk else b""
+            final = not following
+            frame = self._seal_frame(header, counter, final, chunk)
+            dest.write((len(frame) | (STREAM_FINAL if final else 0)).to_bytes(4, 'big'))
+            dest.write(frame)
+            total += len(chunk)
+            if final:
+                return total
+            chunk = following
+            counter += 1
+
+    def decrypt_stream(self, source: BinaryIO, dest: BinaryIO) -> int:
+        """
+        Decrypt a stream written by encrypt_stream.
+
+        Raises ValueError if any frame was altered, dropped or reordered,
+        is longer than the header's chunk size allows, or the stream ends
+        before its final frame. Plaintext is written as each frame checks
+        out, so on error dest holds a partial result.
+        Returns the number of plaintext bytes written.
+        """
+        header = source.read(STREAM_HEADER_SIZE)
+        if len(header) != STREAM_HEADER_SIZE:
+            raise ValueError("Truncated encrypted stream")
+        if header[0] not in CIPHER_MODES.values():
+            raise ValueError(f"Unknown encrypted stream format: {header[0]:#x}")
+        chunk_size = int.from_bytes(header[1 + STREAM_ID_SIZE:], 'big')
+        if not 0 < chunk_size <= STREAM_MAX_CHUNK_SIZE:
+            raise ValueError(f"Invalid encrypted stream chunk size: {chunk_size}")
+        # Checked before reading, so a forged length cannot force a huge allocation
+        max_frame = chunk_size + STREAM_FRAME_OVERHEAD
+        total = 0
+        counter = 0
+        while True:
+            length = source.read(4)
+            if len(length) != 4:
+                raise ValueError("Truncated encrypted stream")
+            length = int.from_bytes(length, 'big')
+            final = bool(length & STREAM_FINAL)
+            length &= ~STREAM_FINAL
+            if length > max_frame:
+                raise ValueError(f"Encrypted stream frame too large (frame {counter})")
+            frame = source.read(length)
+            if len(frame) != length:
+                raise ValueError("Truncated encrypted stream")
+            chunk = self._open_frame(header, counter, final, frame)
+            dest.write(chunk)
+            total += len(chunk)
+            if final:
+                if source.read(1):
+                    raise ValueError("Data after the end of the encrypted stream")
+                return total
+            counter += 1
+
     def encrypt_message(self, message: str, key: bytes) -> Tuple[bytes, bool]:
         """
         Encrypt a message using Fernet symmetric encryption.
         Returns tuple of (encrypted_message, success)
         """
         try:
-            cipher = Fernet(key)
+            cipher = _fernet_for(key)
             return cipher.encrypt(message.encode()), True
         except Exception as e:
             print(f"\033[1;31mEncryption error: {str(e)}\033[0m")
@@ -68,7 +500,7 @@ class CryptoOperations:
         Returns tuple of (decrypted_message, success)
         """
         try:
-            cipher = Fernet(key)
+            cipher = _fernet_for(key)
             decrypted = cipher.decrypt(encrypted_message)
             return decrypted.decode(), True
         except Exception as e:
@@ -77,21 +509,61 @@ class CryptoOperations:
 
     def hash_password(self, password: str) -> str:
         """Create a secure hash of a password."""
-        salt = os.urandom(16)
-        hashed = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000)
+        salt = os.urandom(PASSWORD_SALT_SIZE)
+        hashed = _hash_attempt(password, salt)
         return base64.b64encode(salt + hashed).decode()
         
     def verify_password(self, stored_hash: str, provided_password: str) -> bool:
         """Verify a password against its hash."""
         try:
             decoded = base64.b64decode(stored_hash)
-            salt = decoded[:16]
-            stored_password_hash = decoded[16:]
-            hash_attempt = hashlib.pbkdf2_hmac('sha256', provided_password.encode(), salt, 100000)
-            return hash_attempt == stored_password_hash
+            salt = decoded[:PASSWORD_SALT_SIZE]
+            stored_password_hash = decoded[PASSWORD_SALT_SIZE:]
+            hash_attempt = _hash_attempt(provided_password, salt)
+            return hmac.compare_digest(hash_attempt, stored_password_hash)
         except Exception:
             return False
-            
+
+    def hash_password_async(self, password: str) -> "Future[str]":
+        """hash_password on the shared password pool."""
+        return password_pool().submit(self.hash_password, password)
+
+    def verify_password_async(self, stored_hash: str, provided_password: str,
+                              user: Optional[str] = None) -> "Future[bool]":
+        """
+        verify_password on the shared password pool, so the caller's loop
+        keeps running while PBKDF2 does. Await it from asyncio with
+        asyncio.wrap_future().
+
+        Args:
+            stored_hash: Hash produced by hash_password
+            provided_password: Password to check
+            user: If given, attempts are throttled per user; a locked-out
+                user fails at once without hashing (see throttle.retry_after)
+        """
+        if user is not None and not self.throttle.acquire(user):
+            future: Future = Future()
+            future.set_result(False)
+            return future
+        try:
+            return password_pool().submit(self._verify_login, stored_hash, provided_password, user)
+        except Exception:
+            if user is not None:
+                self.throttle.release(user, None)
+            raise
+
+    def _verify_login(self, stored_hash: str, provided_password: str,
+                      user: Optional[str]) -> bool:
+        # Settle the attempt before the future resolves, so a quick retry
+        # already sees the updated throttle
+        verified = False
+        try:
+            verified = self.verify_password(stored_hash, provided_password)
+        finally:
+            if user is not None:
+                self.throttle.release(user, verified)
+        return verified
+
     @staticmethod
     def hash_data(data: str) -> str:
         """Generate SHA-256 hash of input data."""
@@ -100,9 +572,51 @@ class CryptoOperations:
     @staticmethod
     def generate_multiple_hashes(data: str) -> dict:
         """Generate multiple hash types for input data."""
-        return {
-            'md5': hashlib.md5(data.encode()).hexdigest(),
-            'sha1': hashlib.sha1(data.encode()).hexdigest(), 
-            'sha256': hashlib.sha256(data.encode()).hexdigest(),
-            'sha512': hashlib.sha512(data.encode()).hexdigest()
-        }
+        return CryptoOperations.hash_stream([data.encode()])[0]
+
+    @staticmethod
+    def hash_stream(source: Union[BinaryIO, Iterable[bytes]],
+                    algorithms: Sequence[str] = HASH_ALGORITHMS,
+                    chunk_size: int = HASH_CHUNK_SIZE,
+                    parallel_threshold: int = HASH_PARALLEL_THRESHOLD) -> Tuple[Dict[str, str], int]:
+        """
+        Compute several digests in one pass over a stream.
+
+        The input is read once, chunk by chunk, and every hasher is updated
+        with each chunk, so memory use is one chunk whatever the input
+        size. Once more than parallel_threshold bytes have been seen the
+        hashers are updated on separate threads (hashlib releases the GIL
+        for large updates).
+
+        Args:
+            source: Binary file object, or an iterable of bytes chunks
+            algorithms: hashlib algorithm names
+            chunk_size: Bytes per read from a file object
+            parallel_threshold: Bytes after which updates run in parallel
+
+        Returns:
+            ({algorithm: hexdigest}, total bytes hashed)
+        """
+        if hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(chunk_size), b'')
+        else:
+            chunks = iter(source)
+        hashers = [hashlib.new(name) for name in algorithms]
+        total = 0
+        pool = None
+        try:
+            for chunk in chunks:
+                total += len(chunk)
+                if pool is None and total > parallel_threshold and len(hashers) > 1:
+                    pool = ThreadPoolExecutor(max_workers=len(hashers))
+                if pool is None:
+                    for hasher in hashers:
+                        hasher.update(chunk)
+                else:
+                    # Wait for this chunk before reading the next one
+                    for update in [pool.submit(hasher.update, chunk) for hasher in hashers]:
+                        update.result()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return {name: hasher.hexdigest() for name, hasher in zip(algorithms, hashers)}, total
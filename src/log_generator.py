@@ -1,8 +1,16 @@
 import random
+import threading
 import time
-from typing import List, Callable, Dict
+from typing import List, Callable, Dict, Iterator, TextIO, Union
 from functools import lru_cache
 
+# Lines drawn per block in bulk generation
+LOG_BLOCK_SIZE = 4096
+# Distinct pre-rendered entries kept for bulk generation (must divide 65536)
+LOG_POOL_SIZE = 4096
+# Pool entries regenerated per block
+LOG_POOL_REFRESH = 256
+
 class LogGenerator:
     def __init__(self):
         self.ip_addresses = [
@@ -27,6 +35,19 @@ class LogGenerator:
         # Now populate with pre-generated IPs
         self._cached_ips = [self._generate_new_ip() for _ in range(20)]
 
+        self._log_types = [
+            self._log_network, self._log_firewall, self._log_auth,
+            self._log_system, self._log_crypto, self._log_exploit,
+            self._log_scan, self._log_access, self._log_database,
+            self._log_malware
+        ]
+        # (second, formatted) swapped as one object, so threads never see a torn pair
+        self._timestamp_cache = (None, "")
+        self._pool = None  # Built on first bulk use
+        self._pool_lock = threading.Lock()  # Streams share one generator across threads
+        self._pool_unique: List[str] = []
+        self._pool_cursor = 0
+
     def _generate_new_ip(self) -> str:
         """Generate a completely new IP address without using cache."""
         base = random.choice(self.ip_addresses)
@@ -49,8 +70,13 @@ class LogGenerator:
         return random.randint(1024, 65535)
 
     def generate_timestamp(self) -> str:
-        """Generate a current timestamp."""
-        return time.strftime('%Y-%m-%d %H:%M:%S')
+        """Generate a current timestamp, formatting at most once per second."""
+        second = int(time.time())
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._timestamp_cache = (second, timestamp)
+        return timestamp
         
     # Pre-define log type functions for better performance
     def _log_network(self) -> str:
@@ -85,13 +111,131 @@ class LogGenerator:
 
     def generate_log(self) -> str:
         """Generate a realistic-looking log entry."""
-        log_types = [
-            self._log_network, self._log_firewall, self._log_auth, 
-            self._log_system, self._log_crypto, self._log_exploit,
-            self._log_scan, self._log_access, self._log_database,
-            self._log_malware
-        ]
-        
         timestamp = self.generate_timestamp()
-        log_entry = random.choice(log_types)()
+        log_entry = random.choice(self._log_types)()
         return f"{timestamp} {log_entry}"
+
+    def _draw_ips(self, count: int) -> List[str]:
+        """Draw a block of IPs: 30% fresh, the rest from the cached pool."""
+        fresh = [f"{base}{octet}" for base, octet in zip(
+            random.choices(self.ip_addresses, k=count),
+            random.choices(range(1, 255), k=count))]
+        cached = random.choices(self._cached_ips, k=count)
+        return [f if r > 0.7 else c for f, c, r in
+                zip(fresh, cached, [random.random() for _ in range(count)])]
+
+    def _generate_entries(self, count: int) -> List[str]:
+        """Generate count log entries (no timestamp) from values drawn up front."""
+        port = self.generate_port()
+        kinds = random.choices(range(10), k=count)
+        ips = self._draw_ips(count)
+        users = random.choices(self.usernames, k=count)
+        procs = random.choices(self.processes, k=count)
+        numbers = random.choices(range(1000, 10000), k=count)
+        algos = random.choices(['RSA', 'AES', 'ECC'], k=count)
+
+        entries = []
+        append = entries.append
+        for i, kind in enumerate(kinds):
+            if kind == 0:
+                append(f"[NETWORK] Connection attempt from {ips[i]}:{port}")
+            elif kind == 1:
+                append(f"[FIREWALL] Blocked suspicious traffic from {ips[i]}")
+            elif kind == 2:
+                append(f"[AUTH] Failed login attempt for user '{users[i]}'")
+            elif kind == 3:
+                append(f"[SYSTEM] Process '{procs[i]}' spawned with PID {numbers[i]}")
+            elif kind == 4:
+                append(f"[CRYPTO] Generating new {algos[i]} key pair")
+            elif kind == 5:
+                append(f"[EXPLOIT] Buffer overflow attempt detected in {procs[i]}")
+            elif kind == 6:
+                append(f"[SCAN] Port scan detected from {ips[i]}")
+            elif kind == 7:
+                append(f"[ACCESS] Privilege escalation attempt detected for user '{users[i]}'")
+            elif kind == 8:
+                append(f"[DATABASE] SQL injection attempt blocked from {ips[i]}")
+            else:
+                append(f"[MALWARE] Suspicious file activity detected in /tmp/{numbers[i]}.exe")
+        return entries
+
+    def _refresh_pool(self) -> List[str]:
+        """
+        Return the bulk entry pool, regenerating part of it on each call.
+
+        The pool holds LOG_POOL_SIZE distinct entries, repeated so that a
+        random 16-bit number indexes it directly with no arithmetic.
+        """
+        if self._pool is None:
+            self._pool_unique = self._generate_entries(LOG_POOL_SIZE)
+            self._pool = self._pool_unique * (65536 // LOG_POOL_SIZE)
+            self._pool_cursor = 0
+            return self._pool
+
+        # Keep the noise drifting instead of cycling through a fixed set
+        start = self._pool_cursor
+        for offset, entry in enumerate(self._generate_entries(LOG_POOL_REFRESH)):
+            slot = start + offset
+            self._pool_unique[slot] = entry
+            self._pool[slot::LOG_POOL_SIZE] = [entry] * (65536 // LOG_POOL_SIZE)
+        self._pool_cursor = (start + LOG_POOL_REFRESH) % LOG_POOL_SIZE
+        return self._pool
+
+    def _block_entries(self, count: int) -> List[str]:
+        """
+        count random entries from the pool, indexed by one block of random bits.
+
+        The pool is refreshed and read under a lock, since it is updated in
+        place and several log streams may draw from one generator at once.
+        """
+        indexes = memoryview(random.getrandbits(16 * count).to_bytes(2 * count, 'little')).cast('H')
+        with self._pool_lock:
+            pool = self._refresh_pool()
+            return list(map(pool.__getitem__, indexes))
+
+    def _generate_block(self, count: int) -> List[str]:
+        """Generate count timestamped log lines."""
+        prefix = self.generate_timestamp() + " "
+        return [prefix + entry for entry in self._block_entries(count)]
+
+    def generate_logs(self, n: int, block_size: int = LOG_BLOCK_SIZE) -> Iterator[str]:
+        """
+        Generate n log entries in bulk.
+
+        Entries come from a pre-rendered pool that is partly regenerated
+        every block, picked with random indexes drawn a block at a time,
+        and the timestamp is formatted at most once per second.
+        """
+        remaining = n
+        while remaining > 0:
+            count = min(block_size, remaining)
+            yield from self._generate_block(count)
+            remaining -= count
+
+    def write_logs(self, target: Union[str, TextIO], n: int,
+                   buffer_size: int = 1 << 20, block_size: int = LOG_BLOCK_SIZE) -> int:
+        """
+        Stream n log entries to a file path or open text file.
+
+        Each block is joined and written in one call through a large
+        buffer. Returns the number of characters written.
+        """
+        if isinstance(target, str):
+            with open(target, 'w', buffering=buffer_size) as f:
+                return self.write_logs(f, n, buffer_size, block_size)
+
+        written = 0
+        for chunk in self.log_chunks(n, block_size):
+            target.write(chunk)
+            written += len(chunk)
+        return written
+
+    def log_chunks(self, n: int, block_size: int = LOG_BLOCK_SIZE) -> Iterator[str]:
+        """Generate n log entries as newline-terminated text, one block per chunk."""
+        remaining = n
+        while remaining > 0:
+            count = min(block_size, remaining)
+            prefix = self.generate_timestamp() + " "
+            # Join with the timestamp in the separator so no per-line work is done in Python
+            yield prefix + ("\n" + prefix).join(self._block_entries(count)) + "\n"
+            remaining -= count
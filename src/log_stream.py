@@ -0,0 +1,106 @@
+import threading
+from collections import deque
+from typing import List, Optional, Tuple
+from .log_generator import LogGenerator
+
+# Defaults for live log streams
+STREAM_RATE = 5.0            # Lines per second
+STREAM_MAX_LINES = 1000      # Ring buffer capacity in lines
+STREAM_MAX_BYTES = 256 * 1024  # Ring buffer capacity in bytes
+STREAM_TICK = 0.2            # Seconds between producer batches
+STREAM_MAX_RATE = 5000.0     # Fastest accepted rate in lines per second
+STREAM_MAX_FOLLOWED = 4      # Most logs one session may follow at once
+
+
+class RingBuffer:
+    """
+    Bounded, thread-safe line buffer with sequence numbers.
+
+    The oldest lines are dropped once either the line cap or the byte cap
+    is reached, so a long-running stream never grows without bound.
+    Readers track their position by sequence number.
+    """
+
+    def __init__(self, max_lines: int = STREAM_MAX_LINES, max_bytes: int = STREAM_MAX_BYTES):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._lines: deque = deque()
+        self._bytes = 0
+        self._next_seq = 0  # Sequence number of the next appended line
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._lines)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def extend(self, lines: List[str]):
+        with self._lock:
+            for line in lines:
+                self._lines.append(line)
+                self._bytes += len(line)
+            self._next_seq += len(lines)
+            while self._lines and (len(self._lines) > self.max_lines or self._bytes > self.max_bytes):
+                self._bytes -= len(self._lines.popleft())
+
+    def read_since(self, seq: int, limit: Optional[int] = None) -> Tuple[List[str], int, int]:
+        """
+        Lines appended at or after seq.
+
+        Returns (lines, next_seq, skipped), where skipped counts lines that
+        were dropped from the buffer or passed over because of limit.
+        """
+        with self._lock:
+            first = self._next_seq - len(self._lines)
+            start = max(seq, first)
+            available = self._next_seq - start
+            take = available if limit is None else min(available, limit)
+            # Show the newest lines when a batch is capped
+            offset = start - first + (available - take)
+            lines = [self._lines[i] for i in range(offset, offset + take)]
+            skipped = (start - seq) + (available - take)
+            return lines, self._next_seq, skipped
+
+    def tail(self, count: int) -> List[str]:
+        with self._lock:
+            count = min(count, len(self._lines))
+            return [self._lines[i] for i in range(len(self._lines) - count, len(self._lines))]
+
+
+class LogStream:
+    """A background producer filling a RingBuffer with LogGenerator output."""
+
+    def __init__(self, path: str, generator: LogGenerator, rate: float = STREAM_RATE,
+                 max_lines: int = STREAM_MAX_LINES, max_bytes: int = STREAM_MAX_BYTES):
+        self.path = path
+        self.generator = generator
+        self.rate = rate
+        self.buffer = RingBuffer(max_lines, max_bytes)
+        self.cursor = 0  # Sequence number of the next line to render
+        self._stop = threading.Event()
+        self._carry = 0.0  # Fractional lines owed from previous ticks
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+
+    def start(self) -> "LogStream":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _produce(self):
+        while not self._stop.wait(STREAM_TICK):
+            # Never generate more in one tick than the buffer could keep
+            self._carry = min(self._carry + self.rate * STREAM_TICK, self.buffer.max_lines)
+            count = int(self._carry)
+            if count:
+                self._carry -= count
+                self.buffer.extend(list(self.generator.generate_logs(count)))
+
+    def pending(self, limit: Optional[int] = None) -> Tuple[List[str], int]:
+        """New lines since the last call, and how many were skipped."""
+        lines, self.cursor, skipped = self.buffer.read_since(self.cursor, limit)
+        return lines, skipped
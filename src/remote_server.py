@@ -1,34 +1,202 @@
+import bisect
+import math
 import random
-import time
+import re
+import shlex
+import sys
+import threading
 import datetime
-from typing import List, Dict
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from .commands import CommandRegistry
+from .completion import complete_sorted, split_line
 from .terminal_effects import TerminalEffects
-from .crypto_utils import CryptoOperations
+from .crypto_utils import HASH_CHUNK_SIZE, CryptoOperations
+from .log_generator import LogGenerator
+from .log_stream import (LogStream, STREAM_MAX_FOLLOWED, STREAM_MAX_LINES,
+                         STREAM_MAX_RATE, STREAM_RATE)
+from .search_index import TOKEN_RE, SearchIndex
+
+def day_stamp(date: datetime.date) -> int:
+    """Compact integer form of a date (proleptic Gregorian ordinal)."""
+    return date.toordinal()
+
+DEFAULT_DAY = day_stamp(datetime.date(2024, 12, 1))
 
-@dataclass
 class FileNode:
-    name: str
-    content: str
-    is_encrypted: bool = False
-    is_hidden: bool = False
-    permissions: str = "rw-r--r--"
-    created_date: str = "2024-12-01"
-    modified_date: str = "2024-12-01"
-    file_size: int = 0
-    owner: str = "root"
-    type: str = "txt"  # txt, log, bin, dat, etc.
+    """
+    A file on the remote server.
+
+    Slotted to keep per-file overhead small on large generated servers:
+    content is stored as UTF-8 bytes, repeated metadata strings are
+    interned, and dates are integer day stamps formatted only on display.
+    """
+    __slots__ = ('name', '_content', 'is_encrypted', 'is_hidden', 'permissions',
+                 'created_day', 'modified_day', 'file_size', 'owner', 'type')
+
+    def __init__(self, name: str, content: Union[str, bytes], is_encrypted: bool = False,
+                 is_hidden: bool = False, permissions: str = "rw-r--r--",
+                 created_day: int = DEFAULT_DAY, modified_day: int = DEFAULT_DAY,
+                 file_size: int = 0, owner: str = "root", type: str = "txt"):
+        self.name = name
+        self.content = content
+        self.is_encrypted = is_encrypted
+        self.is_hidden = is_hidden
+        self.permissions = sys.intern(permissions)
+        self.created_day = created_day
+        self.modified_day = modified_day
+        self.file_size = file_size
+        self.owner = sys.intern(owner)
+        self.type = sys.intern(type)  # txt, log, bin, dat, etc.
+
+    @property
+    def content(self) -> Optional[str]:
+        """The file's text, or None for encrypted files (see raw_content)."""
+        if self.is_encrypted:
+            return None
+        return self._content.decode()
+
+    @content.setter
+    def content(self, value: Union[str, bytes]):
+        self._content = value.encode() if isinstance(value, str) else value
+
+    @property
+    def raw_content(self) -> bytes:
+        """Stored bytes: UTF-8 text, or the ciphertext envelope if encrypted."""
+        return self._content
+
+    @property
+    def created_date(self) -> str:
+        return datetime.date.fromordinal(self.created_day).isoformat()
+
+    @property
+    def modified_date(self) -> str:
+        return datetime.date.fromordinal(self.modified_day).isoformat()
+
+    def __repr__(self) -> str:
+        return (f"FileNode(name={self.name!r}, size={self.file_size}, "
+                f"owner={self.owner!r}, type={self.type!r}, encrypted={self.is_encrypted})")
+
+# Maximum number of (current_path, path) resolutions remembered per server
+PATH_CACHE_SIZE = 1024
+
+# Most streamed log lines shown per command; older ones are summarised
+LOG_RENDER_BATCH = 50
+
+# Most matching lines grep prints before truncating
+GREP_MAX_LINES = 200
+
+# Cap on decrypted plaintext kept in memory per server, in characters
+PLAINTEXT_CACHE_SIZE = 64 * 1024
+
+class DirNode:
+    """A directory in the server tree with per-node, sorted child indexes."""
+
+    def __init__(self, name: str, parent: Optional["DirNode"] = None):
+        self.name = name
+        self.parent = parent
+        # Frozen nodes belong to a shared image and are copied before writes
+        self.frozen = False
+        self.subdirs: Dict[str, "DirNode"] = {}
+        self.files: Dict[str, FileNode] = {}
+        # Names kept sorted on insert so listings never sort
+        self.subdir_names: List[str] = []
+        self.file_names: List[str] = []
+
+    @property
+    def path(self) -> str:
+        if self.parent is None:
+            return "/"
+        parent_path = self.parent.path
+        return f"{parent_path.rstrip('/')}/{self.name}"
+
+    def _check_writable(self):
+        if self.frozen:
+            raise RuntimeError(f"Cannot modify shared directory {self.path}")
+
+    def add_dir(self, name: str) -> "DirNode":
+        """Return the named subdirectory, creating it if needed."""
+        node = self.subdirs.get(name)
+        if node is None:
+            self._check_writable()
+            node = DirNode(name, self)
+            self.subdirs[name] = node
+            bisect.insort(self.subdir_names, name)
+        return node
+
+    def add_file(self, node: FileNode):
+        """Add or replace a file in this directory."""
+        self._check_writable()
+        if node.name not in self.files:
+            bisect.insort(self.file_names, node.name)
+        self.files[node.name] = node
+
+    def walk(self) -> Iterator["DirNode"]:
+        """Yield this directory and every directory below it."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.subdirs[name] for name in reversed(node.subdir_names))
+
+    def copy(self, parent: Optional["DirNode"]) -> "DirNode":
+        """Shallow, writable copy; children stay shared with the original."""
+        node = DirNode(self.name, parent)
+        node.subdirs = dict(self.subdirs)
+        node.files = dict(self.files)
+        node.subdir_names = list(self.subdir_names)
+        node.file_names = list(self.file_names)
+        return node
+
+    def freeze(self) -> "DirNode":
+        """Mark this tree as a shared, read-only image."""
+        for node in self.walk():
+            node.frozen = True
+        return self
+
+# Read-only filesystem images (tree and search index) shared by every server of a class
+_base_images: Dict[type, Tuple[DirNode, SearchIndex]] = {}
+_base_images_lock = threading.Lock()
 
 class RemoteServer:
-    def __init__(self):
+    # Built once as the handlers below are defined; plugins may add to it
+    commands = CommandRegistry(help_width=8)
+
+    def __init__(self, use_shared_image: bool = True,
+                 log_generator: Optional[LogGenerator] = None):
         self.current_path = "/home"  # Changed from "/" to "/home"
+        self.connected = True  # Cleared by the 'exit' command
         self.effects = TerminalEffects()
         self.crypto = CryptoOperations()
-
-        # Initialize filesystem structure first
-        self.filesystem = {}
-        self._init_directory_structure()
-        self._initialize_filesystem()
+        self._path_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self.log_generator = log_generator
+        self.log_streams: Dict[str, LogStream] = {}
+        # Encrypted files this session has decrypted, and a bounded plaintext LRU
+        self.decrypted: Set[str] = set()
+        self._plaintext_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._plaintext_size = 0
+
+        if use_shared_image:
+            # Start from the shared image; writes copy only the touched path
+            self.filesystem, base_index = self._shared_image()
+            self.search_index = SearchIndex(self._search_text, base=base_index)
+        else:
+            # Initialize filesystem structure first
+            self.filesystem = DirNode("")
+            self.search_index = SearchIndex(self._search_text)
+            self._init_directory_structure()
+            self._initialize_filesystem()
+
+    @classmethod
+    def _shared_image(cls) -> Tuple[DirNode, SearchIndex]:
+        """Build this class's filesystem once and return the frozen tree and its index."""
+        with _base_images_lock:
+            image = _base_images.get(cls)
+            if image is None:
+                builder = cls(use_shared_image=False)
+                image = (builder.filesystem.freeze(), builder.search_index)
+                _base_images[cls] = image
+            return image
 
     def _init_directory_structure(self):
         """Initialize all directories first"""
@@ -50,7 +218,95 @@ class RemoteServer:
             "/blackbox"
         ]
         for directory in directories:
-            self.filesystem[directory] = {}
+            self._add_directory(directory)
+
+    def _add_directory(self, path: str) -> DirNode:
+        """
+        Create a directory and any missing parents, returning its node.
+
+        The returned node is always writable: shared nodes along the path
+        are copied into this server's overlay first.
+        """
+        if self.filesystem.frozen:
+            self.filesystem = self.filesystem.copy(None)
+        node = self.filesystem
+        for part in path.split("/"):
+            if not part:
+                continue
+            child = node.subdirs.get(part)
+            if child is None:
+                # The directory structure changed; drop cached resolutions
+                self._path_cache.clear()
+                child = node.add_dir(part)
+            elif child.frozen:
+                child = child.copy(node)
+                node.subdirs[part] = child
+            node = child
+        return node
+
+    def _find_dir(self, path: str) -> Optional[DirNode]:
+        """Look up a directory by absolute path in O(depth)."""
+        node = self.filesystem
+        for part in path.split("/"):
+            if part:
+                node = node.subdirs.get(part)
+                if node is None:
+                    return None
+        return node
+
+    def _find_file(self, path: str) -> Optional[FileNode]:
+        """Look up a file by absolute path in O(depth)."""
+        directory, _, filename = path.rpartition("/")
+        parent = self._find_dir(directory)
+        if parent is None:
+            return None
+        return parent.files.get(filename)
+
+    def _search_text(self, path: str) -> Optional[str]:
+        """Plaintext of a file for the search index, if it is readable."""
+        node = self._find_file(path)
+        if node is None:
+            return None
+        return self._plaintext(path, node)
+
+    def _plaintext(self, path: str, node: FileNode) -> Optional[str]:
+        """Readable text of a file; encrypted files only once decrypted."""
+        if not node.is_encrypted:
+            return node.content
+        if path not in self.decrypted:
+            return None
+        return self._decrypt_file(path, node)
+
+    def _decrypt_file(self, path: str, node: FileNode) -> str:
+        """Decrypt a file's ciphertext, going through the plaintext LRU."""
+        cache = self._plaintext_cache
+        text = cache.get(path)
+        if text is not None:
+            cache.move_to_end(path)
+            return text
+
+        text = self.crypto.decrypt_bytes(node.raw_content).decode()
+        cache[path] = text
+        self._plaintext_size += len(text)
+        # Evict least recently read plaintext, but always keep the newest entry
+        while self._plaintext_size > PLAINTEXT_CACHE_SIZE and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+            self._plaintext_size -= len(evicted)
+        return text
+
+    def _forget_plaintext(self, path: str):
+        """Drop decrypted state for a file whose contents changed."""
+        self.decrypted.discard(path)
+        text = self._plaintext_cache.pop(path, None)
+        if text is not None:
+            self._plaintext_size -= len(text)
+
+    def iter_files(self) -> Iterator[Tuple[str, FileNode]]:
+        """Yield (path, node) for every file on the server."""
+        for directory in self.filesystem.walk():
+            base = directory.path.rstrip("/")
+            for filename in directory.file_names:
+                yield f"{base}/{filename}", directory.files[filename]
 
     def _add_file(self, path: str, content: str, is_encrypted: bool = False, 
                   is_hidden: bool = False, permissions: str = "rw-r--r--",
@@ -81,34 +337,37 @@ class RemoteServer:
         
         # Calculate a realistic file size
         file_size = len(content) + random.randint(10, 100)  # Add some variability
+
+        # Encrypted files are stored as ciphertext and decrypted on demand
+        stored = self.crypto.encrypt_bytes(content.encode()) if is_encrypted else content
         
         # Generate creation and modified dates
-        base_date = time.strftime('%Y-%m-%d')
+        today = day_stamp(datetime.date.today())
         modified_offset = random.randint(0, 30)  # Days ago
         created_offset = random.randint(modified_offset, 60)  # Even earlier
-        
-        modified_date = (datetime.datetime.now() - 
-                        datetime.timedelta(days=modified_offset)).strftime('%Y-%m-%d')
-        created_date = (datetime.datetime.now() - 
-                        datetime.timedelta(days=created_offset)).strftime('%Y-%m-%d')
 
-        # Ensure the directory exists
-        if directory not in self.filesystem:
-            self.filesystem[directory] = {}
-
-        # Create the file node with extended properties
-        self.filesystem[directory][filename] = FileNode(
+        # Create the file node with extended properties, ensuring the directory exists
+        parent = self._add_directory(directory)
+        parent.add_file(FileNode(
             name=filename,
-            content=content,
+            content=stored,
             is_encrypted=is_encrypted,
             is_hidden=is_hidden or filename.startswith('.'),
             permissions=permissions,
-            created_date=created_date,
-            modified_date=modified_date,
+            created_day=today - created_offset,
+            modified_day=today - modified_offset,
             file_size=file_size,
             owner=owner,
             type=file_type
-        )
+        ))
+
+        # Encrypted files are indexed only once their plaintext is known
+        full_path = f"{parent.path.rstrip('/')}/{filename}"
+        self._forget_plaintext(full_path)
+        if is_encrypted:
+            self.search_index.remove(full_path)
+        else:
+            self.search_index.add(full_path, content)
         
     def add_file_series(self, base_path: str, prefix: str, 
                          contents: list, is_encrypted: bool = False):
@@ -352,20 +611,32 @@ NOTE: New entities appear more resistant to sonic deterrents.
 """)
 
     def _normalize_path(self, path: str) -> str:
-        """Convert any path to absolute path with optimized processing."""
+        """Convert any path to absolute path, memoising recent resolutions."""
+        key = (self.current_path, path)
+        cache = self._path_cache
+        resolved = cache.get(key)
+        if resolved is not None:
+            cache.move_to_end(key)
+            return resolved
+
+        resolved = sys.intern(self._resolve_path(self.current_path, path))
+        cache[key] = resolved
+        if len(cache) > PATH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return resolved
+
+    @staticmethod
+    def _resolve_path(current_path: str, path: str) -> str:
+        """Resolve path against current_path into a canonical absolute path."""
         # Quick return for root
         if path == '/':
             return '/'
             
         # Handle relative paths
         if not path.startswith('/'):
-            path = f"{self.current_path.rstrip('/')}/{path}"
-
-        # Optimize common cases
-        if '.' not in path:
-            return path
+            path = f"{current_path.rstrip('/')}/{path}"
 
-        # Handle .. and .
+        # Handle .. and . and repeated or trailing slashes
         parts = []
         for part in path.split('/'):
             if part == '.' or not part:
@@ -380,48 +651,77 @@ NOTE: New entities appear more resistant to sonic deterrents.
 
     def handle_command(self, command: str) -> str:
         """Process user commands and return output."""
+        # Live log lines that arrived since the last prompt come first
+        streamed = self._render_log_streams() if self.log_streams else ""
         parts = command.strip().split()
         if not parts:
-            return ""
+            return streamed
 
         cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-
-        commands = {
-            'dir': self._list_contents,  # Changed from 'list' to 'dir'
-            'cd': self._cd,
-            'cat': self._cat,
-            'pwd': self._pwd,
-            'clear': self._clear,
-            'help': self._help
-        }
-
-        if cmd in commands:
-            return commands[cmd](args)
-        return f"Unknown command: {cmd}"
-
+        args = parts[1:]
+
+        if cmd in self.commands:
+            output = self.commands.dispatch(self, cmd, args)
+        else:
+            output = f"Unknown command: {cmd}"
+        if streamed:
+            return f"{streamed}\n{output}" if output else streamed
+        return output
+
+    def complete(self, line: str) -> List[str]:
+        """Tab completions for the word at the end of line."""
+        words, word = split_line(line)
+        if not words:
+            return self.commands.complete(word)
+        return self._complete_path(word)
+
+    def _complete_path(self, word: str) -> List[str]:
+        """
+        Entries matching a partial path, directories with a trailing '/'.
+        Uses the sorted per-directory indexes, so it costs O(depth + log n)
+        plus the matches, and sees files the moment they are added.
+        """
+        typed_dir, slash, prefix = word.rpartition("/")
+        if slash:
+            directory = self._find_dir(self._normalize_path(typed_dir or "/"))
+            typed_dir += "/"
+        else:
+            directory = self._find_dir(self.current_path)
+        if directory is None:
+            return []
+
+        show_hidden = prefix.startswith(".")
+        matches = [f"{typed_dir}{name}/" for name in complete_sorted(directory.subdir_names, prefix)]
+        matches.extend(f"{typed_dir}{name}" for name in complete_sorted(directory.file_names, prefix)
+                       if show_hidden or not directory.files[name].is_hidden)
+        return matches
+
+    @commands.command('dir', "List directory contents", usage="dir [path]", aliases=('ls',))
     def _list_contents(self, args: List[str]) -> str:
         """List directory contents."""
         path = args[0] if args else self.current_path
         path = self._normalize_path(path)
+        directory = self._find_dir(path)
 
-        if path not in self.filesystem:
+        if directory is None:
             return f"list: cannot access '{path}': No such file or directory"
 
         output = []
 
-        # Get immediate subdirectories
-        subdirs = [d.split("/")[-1] for d in sorted(self.filesystem.keys())
-                  if d.startswith(path + "/") and d.count("/") == path.count("/") + 1]
-
         # Add directories
-        for dirname in subdirs:
+        for dirname in directory.subdir_names:
             output.append(f"<DIR>    {dirname}")
 
         # Add files from current directory
-        for filename, node in sorted(self.filesystem[path].items()):
+        for filename in directory.file_names:
+            node = directory.files[filename]
             if not node.is_hidden:
-                encrypted_marker = "[ENCRYPTED] " if node.is_encrypted else ""
+                if not node.is_encrypted:
+                    encrypted_marker = ""
+                elif f"{directory.path.rstrip('/')}/{filename}" in self.decrypted:
+                    encrypted_marker = "[DECRYPTED] "
+                else:
+                    encrypted_marker = "[ENCRYPTED] "
                 output.append(f"<FILE>   {encrypted_marker}{filename}")
 
         # Format output
@@ -431,56 +731,292 @@ NOTE: New entities appear more resistant to sonic deterrents.
             return header + "\n".join(output) + footer
         return "Directory is empty"
 
+    @commands.command('cd', "Change directory", usage="cd [path]")
     def _cd(self, args: List[str]) -> str:
         """Change directory."""
         if not args:
             self.current_path = "/"
             return ""
 
-        new_path = self._normalize_path(args[0])
+        directory = self._find_dir(self._normalize_path(args[0]))
 
-        if new_path in self.filesystem:
-            self.current_path = new_path
+        if directory is not None:
+            self.current_path = directory.path
             return ""
         return f"cd: {args[0]}: No such file or directory"
 
+    @commands.command('cat', "Display file contents", usage="cat <file>")
     def _cat(self, args: List[str]) -> str:
         """Display file contents."""
         if not args:
             return "Usage: cat <file>"
 
         path = self._normalize_path(args[0])
-        directory = "/".join(path.split("/")[:-1]) or "/"
-        filename = path.split("/")[-1]
+        file_node = self._find_file(path)
 
-        if directory not in self.filesystem or filename not in self.filesystem[directory]:
+        if file_node is None:
             return f"cat: {args[0]}: No such file or directory"
 
-        file_node = self.filesystem[directory][filename]
-        if file_node.is_encrypted:
+        content = self._plaintext(path, file_node)
+        if content is None:
             return f"Error: File is encrypted. Access denied."
-        return file_node.content
+        return content
 
+    @commands.command('decrypt', "Decrypt an encrypted file", usage="decrypt <file>")
+    def _decrypt(self, args: List[str]) -> str:
+        """Decrypt an encrypted file so it can be read and searched."""
+        if not args:
+            return "Usage: decrypt <file>"
+
+        path = self._normalize_path(args[0])
+        file_node = self._find_file(path)
+
+        if file_node is None:
+            return f"decrypt: {args[0]}: No such file or directory"
+        if not file_node.is_encrypted:
+            return f"decrypt: {args[0]}: File is not encrypted"
+        if path in self.decrypted:
+            return f"decrypt: {args[0]}: Already decrypted"
+
+        try:
+            text = self._decrypt_file(path, file_node)
+        except Exception:
+            return f"decrypt: {args[0]}: Decryption failed - Invalid data or key"
+        self.decrypted.add(path)
+        self.search_index.add(path, text)
+        return f"[+] {args[0]} decrypted ({len(text.encode())} bytes). Use 'cat' to read it."
+
+    @commands.command('pwd', "Print working directory")
     def _pwd(self, args: List[str]) -> str:
         """Print working directory."""
         return self.current_path
 
+    @commands.command('help', "Show this help message ('help <command>' for details)", usage="help [command]", aliases=('?',))
     def _help(self, args: List[str]) -> str:
         """Display help information."""
-        return """Available commands:
-dir     - List directory contents
-cd      - Change directory
-cat     - Display file contents
-pwd     - Print working directory
-clear   - Clear screen
-help    - Show this help message
-exit    - Exit session"""
+        return self.commands.help_text(args[0] if args else None)
+
+    @commands.command('tail', "Show the end of a file ('tail -f /var/log/<name>' to follow, 'tail --stop' to end)",
+                      usage="tail [-n lines] <file> | tail -f /var/log/<name> [--rate N] | tail --stop [file]")
+    def _tail(self, args: List[str]) -> str:
+        """Show the end of a file, or follow a live log under /var/log."""
+        usage = "Usage: tail [-n lines] <file> | tail -f /var/log/<name> [--rate N] | tail --stop [file]"
+        follow = stop = False
+        count, rate = 10, STREAM_RATE
+        paths = []
+        try:
+            i = 0
+            while i < len(args):
+                arg = args[i]
+                if arg == '-f':
+                    follow = True
+                elif arg == '--stop':
+                    stop = True
+                elif arg in ('-n', '--rate'):
+                    i += 1
+                    if arg == '-n':
+                        count = int(args[i])
+                    else:
+                        rate = float(args[i])
+                else:
+                    paths.append(arg)
+                i += 1
+        except (IndexError, ValueError):
+            return usage
+
+        if stop:
+            targets = [self._normalize_path(p) for p in paths] or list(self.log_streams)
+            stopped = [path for path in targets if path in self.log_streams]
+            for path in stopped:
+                self.log_streams.pop(path).stop()
+            return "\n".join(f"tail: stopped following {path}" for path in stopped) or "tail: nothing to stop"
+
+        if len(paths) != 1 or count < 0:
+            return usage
+        if not (math.isfinite(rate) and 0 < rate <= STREAM_MAX_RATE):
+            return f"tail: --rate must be between 0 and {STREAM_MAX_RATE:g} lines/s"
+        path = self._normalize_path(paths[0])
+
+        if follow:
+            directory, _, name = path.rpartition("/")
+            if directory != "/var/log" or not name:
+                return f"tail: {paths[0]}: can only follow logs in /var/log"
+            if path not in self.log_streams:
+                if len(self.log_streams) >= STREAM_MAX_FOLLOWED:
+                    return (f"tail: already following {STREAM_MAX_FOLLOWED} logs"
+                            " (use 'tail --stop <file>' first)")
+                if self.log_generator is None:
+                    self.log_generator = LogGenerator()
+                self.log_streams[path] = LogStream(path, self.log_generator, rate).start()
+            else:
+                self.log_streams[path].rate = rate
+            return f"tail: following {path} at {rate:g} lines/s (new lines appear at each prompt)"
+
+        if path in self.log_streams:
+            return "\n".join(self.log_streams[path].buffer.tail(count))
+        file_node = self._find_file(path)
+        if file_node is None:
+            return f"tail: {paths[0]}: No such file or directory"
+        content = self._plaintext(path, file_node)
+        if content is None:
+            return "Error: File is encrypted. Access denied."
+        return "\n".join(content.splitlines()[-count:]) if count else ""
+
+    def _scope(self, path: Optional[str]) -> Optional[Callable[[str], bool]]:
+        """
+        Predicate for paths at or under path (None for everything).
+        Raises FileNotFoundError if path does not exist.
+        """
+        if path is None:
+            return None
+        target = self._normalize_path(path)
+        if self._find_file(target) is not None:
+            return lambda p: p == target
+        if self._find_dir(target) is None:
+            raise FileNotFoundError(path)
+        prefix = target.rstrip("/") + "/"
+        return lambda p: p.startswith(prefix)
+
+    @commands.command('grep', "Find lines matching text in files ('grep [-i] [-E] [-l] <pattern> [path]')",
+                      usage="grep [-i] [-E] [-l] <pattern> [path]")
+    def _grep(self, args: List[str]) -> str:
+        """Print lines matching a phrase (or regex with -E) across files."""
+        usage = "Usage: grep [-i] [-E] [-l] <pattern> [path]"
+        try:
+            words = shlex.split(" ".join(args))
+        except ValueError:
+            words = args
+        flags = {w for w in words if w in ('-i', '-E', '-l')}
+        operands = [w for w in words if w not in flags]
+        if not operands or len(operands) > 2:
+            return usage
+        pattern = operands[0]
+        ignore_case = '-i' in flags
+        try:
+            scope = self._scope(operands[1] if len(operands) > 1 else None)
+        except FileNotFoundError:
+            return f"grep: {operands[1]}: No such file or directory"
+
+        if '-E' in flags:
+            try:
+                regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+            except re.error as e:
+                return f"grep: invalid regex: {e}"
+            paths = self.search_index.search_regex(regex, scope)
+            matches_line = regex.search
+        else:
+            # The index narrows candidates by token, then the phrase is checked
+            paths = self.search_index.search(pattern, scope, ignore_case)
+            needle = pattern.lower() if ignore_case else pattern
+            matches_line = ((lambda line: needle in line.lower()) if ignore_case
+                            else (lambda line: needle in line))
+
+        if '-l' in flags:
+            return "\n".join(paths)
+        output = []
+        for path in paths:
+            for line in self.search_index.content(path).splitlines():
+                if matches_line(line):
+                    output.append(f"{path}: {line.strip()}")
+                    if len(output) >= GREP_MAX_LINES:
+                        output.append(f"[... output truncated at {GREP_MAX_LINES} lines ...]")
+                        return "\n".join(output)
+        return "\n".join(output)
+
+    def _hash_chunks(self, path: str, lines: Optional[int]) -> Optional[Iterator[bytes]]:
+        """Bytes of a file, a followed log or freshly generated log lines, in chunks."""
+        if lines is not None:
+            if self.log_generator is None:
+                self.log_generator = LogGenerator()
+            return (chunk.encode() for chunk in self.log_generator.log_chunks(lines))
+        if path in self.log_streams:
+            text = "\n".join(self.log_streams[path].buffer.tail(STREAM_MAX_LINES))
+            return iter([text.encode()])
+        file_node = self._find_file(path)
+        if file_node is None:
+            return None
+        # Encrypted files hash as stored (ciphertext); slices share the buffer
+        data = memoryview(file_node.raw_content)
+        return (data[i:i + HASH_CHUNK_SIZE] for i in range(0, len(data), HASH_CHUNK_SIZE))
+
+    @commands.command('hash', "Print MD5/SHA-1/SHA-256/SHA-512 of a file ('hash -n <lines> /var/log/<name>' for a fresh log)",
+                      usage="hash <file> | hash -n <lines> /var/log/<name>")
+    def _hash(self, args: List[str]) -> str:
+        """Print every digest of a file, computed in one streaming pass."""
+        usage = "Usage: hash <file> | hash -n <lines> /var/log/<name>"
+        lines = None
+        try:
+            if args and args[0] == '-n':
+                lines = int(args[1])
+                args = args[2:]
+        except (IndexError, ValueError):
+            return usage
+        if len(args) != 1 or (lines is not None and lines < 0):
+            return usage
 
+        path = self._normalize_path(args[0])
+        if lines is not None and path.rpartition("/")[0] != "/var/log":
+            return f"hash: {args[0]}: can only generate logs in /var/log"
+        chunks = self._hash_chunks(path, lines)
+        if chunks is None:
+            return f"hash: {args[0]}: No such file or directory"
+
+        digests, size = self.crypto.hash_stream(chunks)
+        output = [f"{name:<7} {digest}" for name, digest in digests.items()]
+        output.append(f"{size} bytes  {path}")
+        return "\n".join(output)
+
+    @commands.command('search', "List files containing all of the given words", usage="search <words...>")
+    def _search(self, args: List[str]) -> str:
+        """List files containing every given word (case-insensitive)."""
+        if not args:
+            return "Usage: search <words>"
+        words = [w.strip("\"'") for w in args]
+        found = None
+        for word in words:
+            tokens = TOKEN_RE.findall(word.lower())
+            if len(tokens) == 1 and tokens[0] == word.lower():
+                paths = self.search_index.lookup(tokens[0])  # Whole word: one index hit
+            else:
+                paths = set(self.search_index.search(word))
+            found = paths if found is None else found & paths
+            if not found:
+                break
+        if not found:
+            return f"search: no files contain {' '.join(words)}"
+        return "\n".join(sorted(found)) + f"\n\n{len(found)} file(s)"
+
+    def _render_log_streams(self) -> str:
+        """Collect new lines from every followed log, capped per stream."""
+        output = []
+        for path, stream in self.log_streams.items():
+            lines, skipped = stream.pending(LOG_RENDER_BATCH)
+            if skipped:
+                output.append(f"==> {path} <== ({skipped} earlier lines skipped)")
+            elif lines and len(self.log_streams) > 1:
+                output.append(f"==> {path} <==")
+            output.extend(lines)
+        return "\n".join(output)
+
+    def close(self):
+        """Stop background work such as followed logs."""
+        for stream in self.log_streams.values():
+            stream.stop()
+        self.log_streams.clear()
+
+    @commands.command('clear', "Clear screen", aliases=('cls',))
     def _clear(self, args: List[str]) -> str:
         """Clear the screen."""
         self.effects.clear_screen()
         return ""
 
+    @commands.command('exit', "Exit session", aliases=('logout',), max_args=0)
+    def _exit(self, args: List[str]) -> str:
+        """Close the connection."""
+        self.close()
+        self.connected = False
+        return "\n[!] Connection terminated"
+
     def start_session(self):
         """Start an interactive session with the remote server."""
         self.effects.clear_screen()
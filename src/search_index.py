@@ -0,0 +1,214 @@
+import bisect
+import re
+from typing import Callable, Dict, FrozenSet, List, Optional, Set
+from .completion import complete_sorted
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# A partial pattern token matching more vocabulary tokens than this (e.g. a
+# single letter) narrows the candidates too little to be worth expanding
+MAX_EXPANSION = 256
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lower-case alphanumeric tokens in text."""
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+class Vocabulary:
+    """
+    The tokens of one index layer, arranged for partial-token lookups:
+    sorted for prefixes, sorted reversed for suffixes, and joined into one
+    string that str.find scans for infixes.
+    """
+
+    def __init__(self, words):
+        self.words = sorted(words)
+        self.reversed = sorted(word[::-1] for word in self.words)
+        self.text = "\n".join(self.words)
+        self.starts: List[int] = []
+        offset = 0
+        for word in self.words:
+            self.starts.append(offset)
+            offset += len(word) + 1
+
+    def matching(self, part: str, open_left: bool, open_right: bool,
+                 limit: int = MAX_EXPANSION) -> Optional[List[str]]:
+        """Tokens part can be the start, end or middle of; None past limit."""
+        if not open_left:
+            found = complete_sorted(self.words, part)
+        elif not open_right:
+            found = [word[::-1] for word in complete_sorted(self.reversed, part[::-1])]
+        else:
+            found = []
+            position = self.text.find(part)
+            while position != -1 and len(found) <= limit:
+                i = bisect.bisect_right(self.starts, position) - 1
+                found.append(self.words[i])
+                # Carry on from the next token, so each is listed once
+                following = self.starts[i + 1] if i + 1 < len(self.starts) else len(self.text)
+                position = self.text.find(part, following)
+        return found if len(found) <= limit else None
+
+
+class SearchIndex:
+    """
+    Inverted token index over file contents, keyed by file path.
+
+    The index does not keep file contents; loader(path) fetches the
+    plaintext when a phrase or regex has to be checked. An index can sit
+    on top of a read-only base index (the shared server image): additions
+    go into this index, and paths changed here hide the base entries for
+    the same path. Encrypted files are not indexed; they are added once
+    their plaintext is available.
+    """
+
+    def __init__(self, loader: Callable[[str], Optional[str]],
+                 base: Optional["SearchIndex"] = None):
+        self.loader = loader
+        self.base = base
+        self.postings: Dict[str, Set[str]] = {}
+        self.tokens: Dict[str, FrozenSet[str]] = {}
+        # Base paths that were replaced or removed in this index
+        self.shadowed: Set[str] = set()
+        self._vocabulary: Optional[Vocabulary] = None  # Rebuilt after tokens come or go
+
+    def __len__(self):
+        return len(self.paths())
+
+    def add(self, path: str, content: str):
+        """Index (or re-index) a file's plaintext."""
+        self.remove(path)
+        tokens = frozenset(tokenize(content))
+        self.tokens[path] = tokens
+        for token in tokens:
+            paths = self.postings.get(token)
+            if paths is None:
+                paths = self.postings[token] = set()
+                self._vocabulary = None
+            paths.add(path)
+
+    def remove(self, path: str):
+        """Forget a file, including any base entry for it."""
+        for token in self.tokens.pop(path, ()):
+            paths = self.postings[token]
+            paths.discard(path)
+            if not paths:
+                del self.postings[token]
+                self._vocabulary = None
+        if self.base is not None and self.base.indexed(path):
+            self.shadowed.add(path)
+
+    def indexed(self, path: str) -> bool:
+        if path in self.tokens:
+            return True
+        return self.base is not None and path not in self.shadowed and self.base.indexed(path)
+
+    def content(self, path: str) -> Optional[str]:
+        if path in self.tokens:
+            return self.loader(path)
+        if self.base is not None and path not in self.shadowed:
+            return self.base.content(path)
+        return None
+
+    def paths(self) -> Set[str]:
+        """Every indexed path."""
+        found = set(self.tokens)
+        if self.base is not None:
+            found |= self.base.paths() - self.shadowed
+        return found
+
+    def lookup(self, token: str) -> Set[str]:
+        """Paths whose content contains the token."""
+        found = set(self.postings.get(token, ()))
+        if self.base is not None:
+            found |= self.base.lookup(token) - self.shadowed
+        return found
+
+    def _matching_tokens(self, part: str, open_left: bool,
+                         open_right: bool) -> Optional[Set[str]]:
+        """Tokens of this index and its base that contain part; None if too many."""
+        vocabulary = self._vocabulary
+        if vocabulary is None:
+            vocabulary = self._vocabulary = Vocabulary(self.postings)
+        found = vocabulary.matching(part, open_left, open_right)
+        if found is None:
+            return None
+        found = set(found)
+        if self.base is not None:
+            inherited = self.base._matching_tokens(part, open_left, open_right)
+            if inherited is None:
+                return None
+            found |= inherited
+        return found if len(found) <= MAX_EXPANSION else None
+
+    def _token_matches(self, token: str, open_left: bool, open_right: bool) -> Optional[Set[str]]:
+        """
+        Paths holding a token the pattern token can be part of. A token cut
+        off by the start of the pattern may be the end of a longer token,
+        one cut off by its end may be the start of one. None when the token
+        is too common a fragment to narrow anything down.
+        """
+        if not open_left and not open_right:
+            return self.lookup(token)
+        words = self._matching_tokens(token, open_left, open_right)
+        if words is None:
+            return None
+        found: Set[str] = set()
+        for word in words:
+            found |= self.lookup(word)
+        return found
+
+    def candidates(self, text: str) -> Optional[Set[str]]:
+        """
+        Paths that can contain text as a substring.
+
+        Tokens bounded by non-alphanumerics inside text must be whole
+        tokens of the file; tokens touching either end of text only need
+        to match part of a token, and are checked against the vocabulary.
+        None means the index cannot narrow text down (no tokens, or only
+        fragments common to too many tokens).
+        """
+        lowered = text.lower()
+        terms = {(m.group(), m.start() == 0, m.end() == len(lowered))
+                 for m in TOKEN_RE.finditer(lowered)}
+        if not terms:
+            return None
+        # Whole tokens first: cheapest to look up and usually the most selective
+        ordered = sorted(terms, key=lambda term: (term[1] or term[2],
+                                                  len(self.postings.get(term[0], ()))))
+        found: Optional[Set[str]] = None
+        for token, open_left, open_right in ordered:
+            matches = self._token_matches(token, open_left, open_right)
+            if matches is None:
+                continue  # Matches nearly everything; the phrase check decides
+            found = matches if found is None else found & matches
+            if not found:
+                break
+        return found
+
+    def search(self, text: str, within: Optional[Callable[[str], bool]] = None,
+               ignore_case: bool = True) -> List[str]:
+        """Sorted paths (accepted by within, if given) containing text as a phrase."""
+        candidates = self.candidates(text)
+        if candidates is None:
+            candidates = self.paths()
+        if within is not None:
+            candidates = {path for path in candidates if within(path)}
+        needle = text.lower() if ignore_case else text
+        matches = []
+        for path in candidates:
+            content = self.content(path)
+            if content is None:
+                continue
+            if ignore_case:
+                content = content.lower()
+            if needle in content:
+                matches.append(path)
+        return sorted(matches)
+
+    def search_regex(self, pattern: "re.Pattern",
+                     within: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Sorted paths with a regex match (scans every indexed file)."""
+        return sorted(path for path in self.paths()
+                      if (within is None or within(path))
+                      and pattern.search(self.content(path) or ""))
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Session recording and timed replay.
+
+A recording is a JSON-lines file:
+
+    {"v": 1, "started": "...", "keyframe_interval": 5.0}   header
+    [dt_ms, "o", "text"]                                   output chunk
+    [dt_ms, "i", "line"]                                   input line
+    {"k": n, "t": ms, "screen": "..."}                     keyframe
+    {"index": [[ms, offset], ...], "events": n, ...}       trailer
+
+Event times are milliseconds since the previous event (monotonic clock).
+Keyframes carry the absolute time and a redraw of the screen at that
+moment, kept up to date by a small virtual terminal, and the trailer
+lists their byte offsets, so a player can seek by jumping to the nearest
+keyframe instead of decoding the whole file. Recordings cut short (no
+trailer) are still playable; the keyframes are found by a scan.
+
+Usage: python -m src.session_record play FILE [--speed 4 | --instant] [--start SECONDS]
+       python -m src.session_record info FILE
+"""
+import argparse
+import bisect
+import datetime
+import json
+import re
+import shutil
+import sys
+import time
+from typing import BinaryIO, Callable, Iterator, List, Optional, TextIO, Tuple
+
+RECORD_VERSION = 1
+KEYFRAME_INTERVAL = 5.0  # Seconds of recording between keyframes
+# Bytes of events between keyframes, at least, so snapshots (a few KiB for
+# a full screen) stay a small share of the file; a seek decodes no more
+# than about this much
+KEYFRAME_BYTES = 16 * 1024
+COALESCE = 0.005         # Output writes this close together become one chunk
+
+BLANK = ("", " ")  # (SGR attributes, character) of an empty cell
+# Control characters and the escape sequences VirtualScreen interprets:
+# CSI sequences (group 1 parameters, group 2 final byte) and two-byte escapes
+_CONTROL = re.compile(r"\033\[([?0-9;]*)[ -/]*([@-~])|\033[^\[]|[\000-\037\177]")
+# An escape sequence cut off at the end of a write
+_PARTIAL = re.compile(r"\033(\[[?0-9;]*[ -/]*)?")
+
+
+class VirtualScreen:
+    """
+    Just enough of a terminal to know what is on screen.
+
+    Understands printable text, newlines, cursor addressing and moves,
+    erase in display/line, SGR attributes and cursor visibility, which
+    covers the shells, the effects and DiffRenderer's cursor-addressed
+    frames. Anything else is skipped.
+    """
+
+    def __init__(self, cols: int = 80, rows: int = 24):
+        self.cols = cols
+        self.rows = rows
+        self.grid: List[List[Tuple[str, str]]] = [[BLANK] * cols for _ in range(rows)]
+        self.x = self.y = 0
+        self.attr = ""  # SGR sequences in effect since the last reset
+        self.cursor_visible = True
+        self.touched = False  # Anything drawn or erased yet
+        self._partial = ""
+
+    def feed(self, text: str):
+        """Apply terminal output."""
+        if self._partial:
+            text = self._partial + text
+            self._partial = ""
+        escape = text.rfind("\033", max(0, len(text) - 32))
+        if escape != -1 and _PARTIAL.fullmatch(text, escape):
+            text, self._partial = text[:escape], text[escape:]
+
+        pos = 0
+        for match in _CONTROL.finditer(text):
+            if match.start() > pos:
+                self._print(text[pos:match.start()])
+            pos = match.end()
+            if match.group(2) is not None:
+                self._csi(match.group(1), match.group(2))
+            else:
+                self._control(match.group())
+        if pos < len(text):
+            self._print(text[pos:])
+
+    def _print(self, run: str):
+        self.touched = True
+        while run:
+            if self.x >= self.cols:
+                self.x = 0
+                self._line_feed()
+            take = run[:self.cols - self.x]
+            self.grid[self.y][self.x:self.x + len(take)] = [(self.attr, char) for char in take]
+            self.x += len(take)
+            run = run[len(take):]
+
+    def _line_feed(self):
+        if self.y == self.rows - 1:
+            self.grid.pop(0)
+            self.grid.append([BLANK] * self.cols)
+        else:
+            self.y += 1
+
+    def _control(self, char: str):
+        if char == "\n":
+            self.x = 0  # Terminals map output newlines to CR LF
+            self._line_feed()
+        elif char == "\r":
+            self.x = 0
+        elif char == "\b":
+            self.x = max(0, min(self.x, self.cols - 1) - 1)
+        elif char == "\t":
+            self.x = min(self.cols - 1, (self.x // 8 + 1) * 8)
+
+    def _csi(self, params: str, final: str):
+        if params.startswith("?"):
+            if params == "?25" and final in "hl":
+                self.cursor_visible = final == "h"
+            return
+        args = [int(arg) if arg else 0 for arg in params.split(";")] if params else []
+        first = args[0] if args else 0
+        count = max(1, first)
+        if final in "Hf":
+            row = args[0] if args else 1
+            col = args[1] if len(args) > 1 else 1
+            self.y = min(max(row, 1), self.rows) - 1
+            self.x = min(max(col, 1), self.cols) - 1
+        elif final == "A":
+            self.y = max(0, self.y - count)
+        elif final == "B":
+            self.y = min(self.rows - 1, self.y + count)
+        elif final == "C":
+            self.x = min(self.cols - 1, self.x + count)
+        elif final == "D":
+            self.x = max(0, min(self.x, self.cols - 1) - count)
+        elif final == "G":
+            self.x = min(max(first, 1), self.cols) - 1
+        elif final == "J":
+            self.touched = True
+            if first == 0:
+                self._erase(self.y, self.x, self.cols)
+                for y in range(self.y + 1, self.rows):
+                    self._erase(y, 0, self.cols)
+            elif first == 1:
+                for y in range(self.y):
+                    self._erase(y, 0, self.cols)
+                self._erase(self.y, 0, self.x + 1)
+            else:
+                for y in range(self.rows):
+                    self._erase(y, 0, self.cols)
+        elif final == "K":
+            self.touched = True
+            if first == 0:
+                self._erase(self.y, self.x, self.cols)
+            elif first == 1:
+                self._erase(self.y, 0, self.x + 1)
+            else:
+                self._erase(self.y, 0, self.cols)
+        elif final == "m":
+            if not args or args[0] == 0:
+                # A reset, possibly followed by new attributes
+                self.attr = f"\033[{params}m" if len(args) > 1 else ""
+            else:
+                self.attr += f"\033[{params}m"
+
+    def _erase(self, y: int, start: int, end: int):
+        end = min(end, self.cols)
+        if start < end:
+            self.grid[y][start:end] = [BLANK] * (end - start)
+
+    def redraw(self) -> str:
+        """Output that paints this screen on any terminal ("" if nothing was drawn)."""
+        if not self.touched:
+            return ""
+        out = ["\033[0m\033[H\033[2J"]
+        for y, row in enumerate(self.grid):
+            end = len(row)
+            while end and row[end - 1] == BLANK:
+                end -= 1
+            if not end:
+                continue
+            out.append(f"\033[{y + 1};1H")
+            attr = ""
+            for cell_attr, char in row[:end]:
+                if cell_attr != attr:
+                    out.append("\033[0m" + cell_attr)
+                    attr = cell_attr
+                out.append(char)
+            if attr:
+                out.append("\033[0m")
+        out.append(f"\033[{self.y + 1};{min(self.x, self.cols - 1) + 1}H{self.attr}")
+        out.append("\033[?25h" if self.cursor_visible else "\033[?25l")
+        return "".join(out)
+
+
+class SessionRecorder:
+    """Append input lines and output chunks to a recording file."""
+
+    def __init__(self, path: str, keyframe_interval: float = KEYFRAME_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic,
+                 size: Optional[Tuple[int, int]] = None):
+        """size is (columns, rows), by default the current terminal's."""
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.clock = clock
+        self._file: BinaryIO = open(path, 'wb')
+        self._offset = 0
+        self._start = clock()
+        self._last_ms = 0          # Absolute time of the last event written
+        self._keyframe_ms = 0
+        self._keyframe_offset = 0
+        self._events = 0
+        cols, rows = size or shutil.get_terminal_size()
+        self._screen = VirtualScreen(cols, rows)
+        self._index: List[Tuple[int, int]] = []
+        self._pending = ""         # Output waiting to be coalesced
+        self._pending_at = 0.0
+        self._write_line({'v': RECORD_VERSION,
+                          'started': datetime.datetime.now().isoformat(timespec='seconds'),
+                          'keyframe_interval': keyframe_interval,
+                          'size': [cols, rows]})
+        self._write_keyframe()
+
+    def _write_line(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode() + b"\n"
+        self._file.write(line)
+        self._offset += len(line)
+
+    def _write_keyframe(self):
+        self._index.append((self._last_ms, self._offset))
+        self._keyframe_ms = self._last_ms
+        self._keyframe_offset = self._offset
+        self._write_line({'k': self._events, 't': self._last_ms, 'screen': self._screen.redraw()})
+
+    def _write_event(self, kind: str, text: str, at: float):
+        at_ms = max(self._last_ms, int((at - self._start) * 1000))
+        if (at_ms - self._keyframe_ms >= self.keyframe_interval * 1000
+                and self._offset - self._keyframe_offset >= KEYFRAME_BYTES):
+            self._write_keyframe()
+        self._write_line([at_ms - self._last_ms, kind, text])
+        self._last_ms = at_ms
+        self._events += 1
+        self._screen.feed(text if kind == 'o' else text + "\n")
+
+    def _flush_output(self):
+        if self._pending:
+            self._write_event('o', self._pending, self._pending_at)
+            self._pending = ""
+
+    def output(self, text: str):
+        """Record text written to the terminal."""
+        if not text:
+            return
+        now = self.clock()
+        if self._pending and now - self._pending_at > COALESCE:
+            self._flush_output()
+        if not self._pending:
+            self._pending_at = now
+        self._pending += text
+
+    def input(self, line: str):
+        """Record a line the player entered."""
+        self._flush_output()
+        self._write_event('i', line, self.clock())
+
+    def tee(self, stream: TextIO) -> "TeeStream":
+        """A stream that writes to stream and records what passes through."""
+        return TeeStream(stream, self)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._flush_output()
+        self._write_line({'index': self._index, 'events': self._events, 'duration': self._last_ms})
+        self._file.close()
+
+
+class TeeStream:
+    """Text stream wrapper that records every write."""
+
+    def __init__(self, stream: TextIO, recorder: SessionRecorder):
+        self.stream = stream
+        self.recorder = recorder
+
+    def write(self, text: str) -> int:
+        self.recorder.output(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name):
+        # flush, fileno, isatty, encoding...: fileno keeps input() on readline
+        return getattr(self.stream, name)
+
+
+class SessionPlayer:
+    """Read a recording and replay it in real time, faster, or at once."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.header = json.loads(f.readline())
+            if self.header.get('v') != RECORD_VERSION:
+                raise ValueError(f"Unsupported recording version: {self.header.get('v')}")
+            trailer = self._read_trailer(f)
+            if trailer is None:
+                trailer = self._scan(f)
+        self.index: List[Tuple[int, int]] = [tuple(entry) for entry in trailer['index']]
+        self.events = trailer['events']
+        self.duration = trailer['duration'] / 1000
+
+    @staticmethod
+    def _read_trailer(f: BinaryIO) -> Optional[dict]:
+        """The index line at the end of the file, if the recording was closed."""
+        f.seek(0, 2)
+        size = f.tell()
+        tail = b""
+        while size > 0 and tail.count(b"\n") < 2:
+            step = min(size, 4096)
+            size -= step
+            f.seek(size)
+            tail = f.read(step) + tail
+        last = tail.rstrip(b"\n").rpartition(b"\n")[2]
+        if last.startswith(b'{"index"'):
+            return json.loads(last)
+        return None
+
+    @staticmethod
+    def _scan(f: BinaryIO) -> dict:
+        """Rebuild the trailer by reading every line (unfinished recordings)."""
+        f.seek(0)
+        f.readline()
+        index, events, now = [], 0, 0
+        offset = f.tell()
+        for line in f:
+            if line.startswith(b'['):
+                try:
+                    now += json.loads(line)[0]
+                except ValueError:
+                    break  # Torn final line
+                events += 1
+            elif line.startswith(b'{"k"'):
+                index.append((json.loads(line)['t'], offset))
+            offset += len(line)
+        return {'index': index, 'events': events, 'duration': now}
+
+    def seek(self, seconds: float) -> Tuple[int, int]:
+        """(time ms, byte offset) of the last keyframe at or before seconds."""
+        times = [t for t, _ in self.index]
+        position = max(0, bisect.bisect_right(times, int(seconds * 1000)) - 1)
+        return self.index[position]
+
+    def read(self, start: float = 0.0) -> Iterator[Tuple[float, str, str]]:
+        """
+        Yield (seconds, kind, text) from the keyframe before start onwards.
+        The first item is the keyframe's screen as kind 's'.
+        """
+        base_ms, offset = self.seek(start)
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            keyframe = json.loads(f.readline())
+            yield base_ms / 1000, 's', keyframe['screen']
+            now = base_ms
+            for line in f:
+                if not line.startswith(b'['):
+                    continue  # Later keyframes and the trailer
+                try:
+                    delta, kind, text = json.loads(line)
+                except ValueError:
+                    return
+                now += delta
+                yield now / 1000, kind, text
+
+    def play(self, out: TextIO, speed: Optional[float] = 1.0, start: float = 0.0,
+             sleep: Callable[[float], None] = time.sleep) -> int:
+        """
+        Replay to out from start seconds.
+
+        Args:
+            out: Stream to write to
+            speed: 1.0 for real time, 4.0 for four times faster, None for instant
+            start: Seconds into the recording to start from; everything
+                before it is drawn at once from the nearest keyframe
+            sleep: Sleep function (replaceable for tests and benchmarks)
+
+        Returns:
+            Characters written
+        """
+        written = 0
+        previous = start
+        for at, kind, text in self.read(start):
+            if speed and at > previous:
+                sleep((at - previous) / speed)
+                previous = at
+            if kind == 'i':
+                text += "\n"  # The terminal echoed the typed line
+            out.write(text)
+            written += len(text)
+            if speed:
+                out.flush()
+        out.flush()
+        return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded session")
+    parser.add_argument("action", choices=("play", "info"))
+    parser.add_argument("file")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier")
+    parser.add_argument("--instant", action="store_true", help="replay without delays")
+    parser.add_argument("--start", type=float, default=0.0, help="seconds to skip to")
+    args = parser.parse_args()
+
+    player = SessionPlayer(args.file)
+    if args.action == "info":
+        print(f"{args.file}: {player.events} events, {player.duration:.1f} s,"
+              f" {len(player.index)} keyframes, recorded {player.header.get('started')}")
+    else:
+        try:
+            player.play(sys.stdout, None if args.instant else args.speed, args.start)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Multi-session line-protocol front-end for RemoteServer.
+
+Many players share one process: each TCP connection gets its own
+RemoteServer, which is cheap because servers share one read-only
+filesystem image and only copy what a session changes. Any telnet
+client works; telnet option negotiation is stripped from the input.
+
+Usage: python -m src.session_server [--host 127.0.0.1] [--port 6666]
+"""
+import argparse
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Optional
+from .remote_server import RemoteServer
+
+IAC = 0xFF  # Telnet "interpret as command"
+SB = 0xFA   # Telnet subnegotiation begin
+SE = 0xF0   # Telnet subnegotiation end
+MAX_LINE = 4096  # Longest accepted input line in bytes
+COMMAND_WORKERS = 8  # Threads running commands; sessions beyond this wait their turn
+
+BANNER = """\033[1;31m=== CONNECTED TO REMOTE SERVER ===\033[0m
+        ===================
+        |    VOIDBORN    |
+        |  ============  |
+        |  ||  ||  ||   |
+        |  ||  ||  ||   |
+        ===================
+\033[1;32mConnection established. Starting in home directory. Type 'help' for available commands.\033[0m
+"""
+
+
+def strip_telnet(data: bytes) -> bytes:
+    """Remove telnet IAC command and subnegotiation sequences."""
+    if IAC not in data:
+        return data
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        if byte != IAC:
+            out.append(byte)
+            i += 1
+            continue
+        command = data[i + 1] if i + 1 < len(data) else None
+        if command == IAC:  # Escaped 0xFF data byte
+            out.append(IAC)
+            i += 2
+        elif command == SB:
+            end = data.find(bytes([IAC, SE]), i + 2)
+            i = len(data) if end == -1 else end + 2
+        elif command is not None and command >= 0xFB:  # WILL/WONT/DO/DONT + option
+            i += 3
+        else:
+            i += 2
+    return bytes(out)
+
+
+class Session:
+    """State for one connected player."""
+
+    def __init__(self, server: RemoteServer, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, executor: Optional[Executor] = None):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.executor = executor
+
+    async def send(self, text: str):
+        """Write text and wait for the client to drain it (backpressure)."""
+        self.writer.write(text.replace("\n", "\r\n").encode())
+        await self.writer.drain()
+
+    def run_command(self, command: str) -> str:
+        """Run a command against this session's server."""
+        words = command.split()
+        clear = self.server.commands.get('clear')
+        if words and self.server.commands.get(words[0].lower()) is clear:
+            # Never clear the host's terminal on behalf of a remote player
+            return "\033[2J\033[H"
+        return self.server.handle_command(command)
+
+    async def run(self):
+        await self.send(BANNER)
+        while True:
+            await self.send(f"{self.server.current_path}> ")
+            try:
+                line = await self.reader.readline()
+            except (asyncio.LimitOverrunError, ValueError):
+                await self.send("\n[!] Line too long\n")
+                break
+            if not line:
+                break
+            command = strip_telnet(line).decode(errors="replace").strip()
+            # Off the event loop, so a slow command (grep, hash, decrypt) only
+            # holds up its own session; awaiting it keeps one command at a time
+            output = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.run_command, command)
+            if output:
+                await self.send(output + "\n")
+            if not self.server.connected:  # 'exit'
+                break
+
+
+async def serve(host: str = "127.0.0.1", port: int = 6666,
+                server_factory: Callable[[], RemoteServer] = RemoteServer) -> asyncio.AbstractServer:
+    """Start accepting sessions; pass port=0 to pick a free port."""
+    executor = ThreadPoolExecutor(COMMAND_WORKERS, thread_name_prefix="session")
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        server = server_factory()
+        try:
+            await Session(server, reader, writer, executor).run()
+        except ConnectionError:
+            pass
+        finally:
+            server.close()
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port, limit=MAX_LINE)
+
+
+async def _main(host: str, port: int):
+    listener = await serve(host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"[+] VOIDBORN server listening on {address[0]}:{address[1]}")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the remote server over TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6666)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_main(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
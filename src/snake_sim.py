@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Headless snake simulation for tuning and regression testing.
+
+Agents are plain callables: given a state they return an action. Single
+games run through SnakeGame.step(); BatchSnake advances thousands of
+boards in lockstep with NumPy (optional: pip install numpy).
+
+Usage: python -m src.snake_sim [--games 200] [--boards 4096] [--ticks 500]
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, Optional
+from .ascii_games import SnakeGame
+
+try:
+    import numpy as np
+except ImportError:  # Only BatchSnake needs it
+    np = None
+
+# Batch actions: indexes into DIRECTIONS; -1 keeps the current heading
+UP, DOWN, LEFT, RIGHT = range(4)
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+KEYS = ('w', 's', 'a', 'd')
+
+Agent = Callable[[dict], Optional[str]]
+
+
+def random_agent(state: dict) -> Optional[str]:
+    """Turn at random now and then."""
+    return random.choice(KEYS) if random.random() < 0.2 else None
+
+
+def greedy_agent(state: dict) -> Optional[str]:
+    """Head for the food along the shortest wrapped axis, avoiding the body."""
+    if state['food'] is None:
+        return None
+    (hx, hy), (fx, fy) = state['snake'][0], state['food']
+    width, height = state['width'], state['height']
+    body = set(state['snake'])
+
+    dx = (fx - hx) % width
+    dy = (fy - hy) % height
+    preferred = []
+    if dx:
+        preferred.append('d' if dx <= width // 2 else 'a')
+    if dy:
+        preferred.append('s' if dy <= height // 2 else 'w')
+    preferred.extend(KEYS)
+
+    for key in preferred:
+        mx, my = DIRECTIONS[KEYS.index(key)]
+        if (mx, my) == tuple(-d for d in state['direction']):
+            continue  # Reversing is ignored by the game
+        if ((hx + mx) % width, (hy + my) % height) not in body:
+            return key
+    return None
+
+
+def run_games(agent: Agent, games: int, width: int = 20, height: int = 10,
+              max_ticks: int = 10000, seed: Optional[int] = None) -> Dict[str, float]:
+    """Play whole games headlessly and report scores and throughput."""
+    game = SnakeGame(width, height, seed=seed)
+    scores = []
+    ticks = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        state, done = game.reset(), False
+        for _ in range(max_ticks):
+            state, _, done = game.step(agent(state))
+            ticks += 1
+            if done:
+                break
+        scores.append(game.score)
+    elapsed = time.perf_counter() - start
+    return {
+        'games': games,
+        'mean_score': sum(scores) / games if games else 0.0,
+        'max_score': max(scores, default=0),
+        'games_per_sec': games / elapsed,
+        'ticks_per_sec': ticks / elapsed,
+    }
+
+
+class BatchSnake:
+    """
+    Many snake boards advanced together with NumPy.
+
+    Each board is a grid of countdowns: a cell holds how many more ticks
+    the body covers it, so moving is one vectorised decrement and
+    collisions are a single gather. Rules match SnakeGame: walls wrap,
+    reversing is ignored, moving into the current tail is a collision.
+    """
+
+    def __init__(self, boards: int, width: int = 20, height: int = 10,
+                 seed: Optional[int] = None):
+        if np is None:
+            raise ImportError("BatchSnake needs NumPy: pip install numpy")
+        self.boards = boards
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self._index = np.arange(boards)
+        self._moves = np.array(DIRECTIONS, dtype=np.int64)
+
+        self.grid = np.zeros((boards, height, width), dtype=np.int32)
+        self.head = np.zeros((boards, 2), dtype=np.int64)  # (x, y)
+        self.direction = np.zeros((boards, 2), dtype=np.int64)
+        self.food = np.zeros((boards, 2), dtype=np.int64)
+        self.length = np.zeros(boards, dtype=np.int32)
+        self.score = np.zeros(boards, dtype=np.int32)
+        self.done = np.zeros(boards, dtype=bool)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Restart the given boards (all by default) and return the state."""
+        if mask is None:
+            mask = np.ones(self.boards, dtype=bool)
+        mask = np.array(mask, dtype=bool)  # May alias self.done, which we clear
+        if not mask.any():
+            return self.state()
+        self.grid[mask] = 0
+        self.head[mask] = (self.width // 2, self.height // 2)
+        self.direction[mask] = (1, 0)
+        self.length[mask] = 1
+        self.score[mask] = 0
+        self.done[mask] = False
+        hx, hy = self.width // 2, self.height // 2
+        self.grid[mask, hy, hx] = 1
+        self._place_food(mask)
+        return self.state()
+
+    def state(self) -> Dict[str, "np.ndarray"]:
+        return {
+            'grid': self.grid,
+            'head': self.head,
+            'direction': self.direction,
+            'food': self.food,
+            'score': self.score,
+            'done': self.done,
+        }
+
+    def _place_food(self, mask):
+        """Pick a uniformly random free cell on each masked board."""
+        boards = np.flatnonzero(mask)
+        noise = self.rng.random((len(boards), self.height * self.width))
+        noise[self.grid[boards].reshape(len(boards), -1) > 0] = -1.0
+        cell = noise.argmax(axis=1)
+        self.food[boards, 0] = cell % self.width
+        self.food[boards, 1] = cell // self.width
+        return noise[np.arange(len(boards)), cell] >= 0  # False when board is full
+
+    def step(self, actions=None):
+        """
+        Advance every live board one tick.
+
+        Args:
+            actions: Integer array of UP/DOWN/LEFT/RIGHT per board, -1 to
+                keep heading; None keeps every heading
+
+        Returns:
+            (state, reward, done) with per-board reward and done arrays
+        """
+        live = ~self.done
+        if actions is not None:
+            actions = np.asarray(actions)
+            turning = live & (actions >= 0)
+            wanted = self._moves[np.clip(actions, 0, 3)]
+            reversing = (wanted == -self.direction).all(axis=1)
+            turning &= ~reversing
+            self.direction[turning] = wanted[turning]
+
+        new_head = self.head + self.direction
+        new_head[:, 0] %= self.width
+        new_head[:, 1] %= self.height
+        nx, ny = new_head[:, 0], new_head[:, 1]
+
+        hit = live & (self.grid[self._index, ny, nx] > 0)
+        moving = live & ~hit
+        ate = moving & (new_head == self.food).all(axis=1)
+
+        # Tails advance on boards that moved without eating
+        shrink = moving & ~ate
+        self.grid[shrink] -= (self.grid[shrink] > 0).astype(np.int32)
+        self.length[ate] += 1
+        self.head[moving] = new_head[moving]
+        self.grid[moving, ny[moving], nx[moving]] = self.length[moving]
+        self.score[ate] += 1
+
+        reward = ate.astype(np.int32) - hit.astype(np.int32)
+        done = hit
+        if ate.any():
+            placed = self._place_food(ate)
+            full = np.flatnonzero(ate)[~placed]
+            done[full] = True  # Board filled: nothing left to eat
+        self.done |= done
+        return self.state(), reward, self.done
+
+
+def batch_random_agent(state: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """Turn at random on about a fifth of the boards each tick."""
+    boards = len(state['done'])
+    actions = np.random.randint(0, 4, boards)
+    actions[np.random.random(boards) >= 0.2] = -1
+    return actions
+
+
+def batch_greedy_agent(state: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """Turn towards the food on the x axis first, then y (ignores the body)."""
+    head, food = state['head'], state['food']
+    actions = np.full(len(head), -1)
+    actions[food[:, 1] < head[:, 1]] = UP
+    actions[food[:, 1] > head[:, 1]] = DOWN
+    actions[food[:, 0] < head[:, 0]] = LEFT
+    actions[food[:, 0] > head[:, 0]] = RIGHT
+    return actions
+
+
+def run_batch(agent: Callable, boards: int, ticks: int, width: int = 20,
+              height: int = 10, seed: Optional[int] = None) -> Dict[str, float]:
+    """Run boards in lockstep, restarting finished ones, and report throughput."""
+    sim = BatchSnake(boards, width, height, seed=seed)
+    state = sim.state()
+    games = 0
+    total_score = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        state, _, done = sim.step(agent(state))
+        if done.any():
+            games += int(done.sum())
+            total_score += int(sim.score[done].sum())
+            state = sim.reset(done)
+    elapsed = time.perf_counter() - start
+    return {
+        'boards': boards,
+        'games': games,
+        'mean_score': total_score / games if games else 0.0,
+        'games_per_sec': games / elapsed,
+        'board_ticks_per_sec': boards * ticks / elapsed,
+    }
+
+
+def _print_stats(label: str, stats: Dict[str, float]):
+    print(label + ": " + ", ".join(
+        f"{key}={value:,.1f}" if isinstance(value, float) else f"{key}={value}"
+        for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run headless snake simulations")
+    parser.add_argument("--games", type=int, default=200, help="single-board games")
+    parser.add_argument("--boards", type=int, default=4096, help="boards in the batch")
+    parser.add_argument("--ticks", type=int, default=500, help="batch ticks")
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    _print_stats("single greedy", run_games(greedy_agent, args.games, args.width,
+                                             args.height, seed=args.seed))
+    if np is None:
+        print("batch: skipped (NumPy not installed)")
+    else:
+        _print_stats("batch greedy", run_batch(batch_greedy_agent, args.boards, args.ticks,
+                                               args.width, args.height, seed=args.seed))
+        _print_stats("batch random", run_batch(batch_random_agent, args.boards, args.ticks,
+                                               args.width, args.height, seed=args.seed))
@@ -1,11 +1,20 @@
-
 import sys
 import time
 import random
 import os
+from bisect import bisect_right
 from typing import List
 
+# realtime: animated output, batched into frames
+# instant:  everything is drawn, but without waiting
+# headless: plain text only, no screen control, zero wall time
+EFFECT_MODES = ('realtime', 'instant', 'headless')
+
 class TerminalEffects:
+    # Shared by every instance so one switch covers the whole program
+    mode = os.environ.get('VOIDBORN_EFFECTS', 'realtime')
+    fps = 30  # Frames per second for animated output
+
     def __init__(self):
         self.width = 80
         self.height = 24
@@ -17,30 +26,80 @@ class TerminalEffects:
         except:
             pass  # Use defaults if fails
 
+    @classmethod
+    def set_mode(cls, mode: str):
+        """Switch every TerminalEffects to realtime, instant or headless output."""
+        if mode not in EFFECT_MODES:
+            raise ValueError(f"Unknown effects mode: {mode}")
+        cls.mode = mode
+
+    @staticmethod
+    def _write(text: str):
+        """Write one frame of output."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def pause(self, seconds: float):
+        """Sleep for dramatic effect, unless animations are off."""
+        if self.mode == 'realtime':
+            time.sleep(seconds)
+
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.mode == 'headless':
+            return ""
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # What 'clear' prints, written through stdout so recordings see it
+            self._write("\033[H\033[2J\033[3J")
         return ""
 
     def type_text(self, text: str, delay: float = 0.02, newline: bool = True):
-        """Type text with a delay between characters."""
+        """
+        Type text with a delay between characters.
+
+        Characters due within the same frame are written together, so a
+        paragraph costs one write per frame rather than one per character.
+        """
+        if newline:
+            text += "\n"
+        if self.mode != 'realtime' or delay <= 0:
+            self._write(text)
+            return
+
+        # When each character becomes visible, relative to the start
+        due: List[float] = []
+        elapsed = 0.0
         for char in text:
-            sys.stdout.write(char)
-            sys.stdout.flush()
+            due.append(elapsed)
             # Reduce delay for spaces to make it feel more natural
-            time.sleep(delay if char != ' ' else delay/2)
-        if newline:
-            sys.stdout.write("\n")
-        sys.stdout.flush()
+            elapsed += delay if char != ' ' else delay/2
+
+        frame = 1.0 / self.fps
+        start = time.monotonic()
+        shown = 0
+        while shown < len(text):
+            now = time.monotonic() - start
+            ready = bisect_right(due, now, shown)
+            if ready > shown:
+                self._write(text[shown:ready])
+                shown = ready
+            if shown < len(text):
+                time.sleep(max(frame, due[shown] - now))
 
     def progress_bar(self, duration: float, message: str = "Loading"):
         """Display a progress bar that fills over the specified duration."""
         width = min(40, self.width - 20)  # Ensure it fits in the terminal
-        
+
+        if self.mode != 'realtime':
+            self._write(f"\n{message}: [" + "=" * width + "] 100%\n")
+            return
+
         # Pre-calculate some values for efficiency
         steps = width + 1
         sleep_time = duration / steps
-        
+
         sys.stdout.write(f"\n{message}: [" + " " * width + "] 0%")
         sys.stdout.flush()
 
@@ -54,30 +113,38 @@ class TerminalEffects:
 
     def matrix_effect(self, duration: float = 2.0):
         """Display a Matrix-like effect for the specified duration."""
+        if self.mode == 'headless':
+            return
+
         chars = "01"
         cols = self.width
         rows = min(10, self.height - 2)
-        
+
         # Pre-generate some random lines for efficiency
         all_lines = []
         for _ in range(rows * 2):  # Generate extra lines for variation
             all_lines.append("".join(random.choice(chars) for _ in range(cols)))
-        
+
+        if self.mode == 'instant':
+            self._write("".join(f"\033[32m{line}\033[0m\n" for line in all_lines[:rows]))
+            self.clear_screen()
+            return
+
         start_time = time.time()
         line_index = 0
-        
+
         while time.time() - start_time < duration:
             # Use pre-generated lines with some randomization
             line = all_lines[line_index % len(all_lines)]
             line_index += 1
-            
+
             # Occasionally modify some characters for more randomness
             if random.random() > 0.7:
                 pos = random.randint(0, cols-1)
                 line = line[:pos] + random.choice(chars) + line[pos+1:]
-                
+
             sys.stdout.write("\033[32m" + line + "\033[0m\n")
             sys.stdout.flush()
             time.sleep(0.05)
-            
+
         self.clear_screen()
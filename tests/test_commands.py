@@ -0,0 +1,48 @@
+from src.commands import CommandRegistry
+from src.remote_server import RemoteServer
+
+
+class Shell:
+    commands = CommandRegistry()
+
+    @commands.command('greet', "Say hello", aliases=('hi',))
+    def _greet(self, args):
+        return "hello"
+
+
+class LoudShell(Shell):
+    def _greet(self, args):
+        return "HELLO"
+
+
+@Shell.commands.command('echo', "Repeat the arguments")
+def echo(shell, args):
+    return " ".join(args)
+
+
+def test_overridden_methods_are_dispatched():
+    assert Shell.commands.dispatch(Shell(), 'greet', []) == "hello"
+    assert Shell.commands.dispatch(LoudShell(), 'greet', []) == "HELLO"
+    assert Shell.commands.dispatch(LoudShell(), 'hi', []) == "HELLO"
+    assert Shell.commands.dispatch(Shell(), 'greet', []) == "hello"
+
+
+def test_plugin_functions_are_called_as_given():
+    LoudShell.echo = lambda self, args: "not the plugin"
+    try:
+        assert Shell.commands.dispatch(LoudShell(), 'echo', ["a", "b"]) == "a b"
+    finally:
+        del LoudShell.echo
+
+
+def test_server_subclass_override():
+    class QuietServer(RemoteServer):
+        def _pwd(self, args):
+            return "/nowhere"
+
+    server = QuietServer()
+    try:
+        assert server.handle_command("pwd") == "/nowhere"
+        assert RemoteServer().handle_command("pwd") != "/nowhere"
+    finally:
+        server.close()
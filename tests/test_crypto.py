@@ -0,0 +1,187 @@
+import io
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from src.crypto_utils import CryptoOperations, LoginThrottle, clear_key_cache, derive_key
+
+
+@pytest.fixture(scope="module")
+def stored():
+    return CryptoOperations().hash_password("hunter2")
+
+
+def test_verify_password(stored):
+    crypto = CryptoOperations()
+    assert crypto.verify_password(stored, "hunter2")
+    assert not crypto.verify_password(stored, "hunter3")
+    assert not crypto.verify_password("not base64!", "hunter2")
+    assert crypto.verify_password_async(stored, "hunter2", user="admin").result()
+
+
+def test_concurrent_guesses_stop_at_the_limit(stored):
+    crypto = CryptoOperations()
+    crypto.throttle = LoginThrottle(max_failures=5)
+    futures = [crypto.verify_password_async(stored, "guess", user="admin") for _ in range(50)]
+    assert not any(future.result() for future in futures)
+    failures, locked_until, in_flight, _ = crypto.throttle._users["admin"]
+    assert (failures, in_flight) == (5, 0)
+    assert crypto.throttle.retry_after("admin") > 0
+    # Even the right password is refused during the lockout
+    assert not crypto.verify_password_async(stored, "hunter2", user="admin").result()
+
+
+def test_lockout_expires_and_success_resets(stored):
+    crypto = CryptoOperations()
+    crypto.throttle = LoginThrottle(max_failures=2, lockout=0.05)
+    for _ in range(2):
+        assert not crypto.verify_password_async(stored, "guess", user="bob").result()
+    assert not crypto.throttle.acquire("bob")
+    time.sleep(0.06)
+    assert crypto.verify_password_async(stored, "hunter2", user="bob").result()
+    assert "bob" not in crypto.throttle._users
+
+
+def test_in_flight_attempts_count_as_failures():
+    throttle = LoginThrottle(max_failures=3)
+    assert all(throttle.acquire("eve") for _ in range(3))
+    assert not throttle.acquire("eve")
+    throttle.release("eve", None)  # Never ran: frees the slot without counting
+    assert throttle.acquire("eve")
+
+
+def test_table_is_bounded():
+    throttle = LoginThrottle(max_tracked=100)
+    for i in range(1000):
+        assert throttle.acquire(f"user{i}")
+        throttle.release(f"user{i}", False)
+    assert len(throttle) <= 100
+
+
+def frames(data):
+    """(header, [(length field, frame)]) of an encrypted stream."""
+    header, rest, found = data[:12], data[12:], []
+    while rest:
+        field = int.from_bytes(rest[:4], 'big')
+        length = field & 0x7FFFFFFF
+        found.append((rest[:4], rest[4:4 + length]))
+        rest = rest[4 + length:]
+    return header, found
+
+
+def join(header, found):
+    return header + b"".join(field + frame for field, frame in found)
+
+
+@pytest.fixture(params=["fernet", "aesgcm"])
+def sealed(request):
+    crypto = CryptoOperations(mode=request.param)
+    plain = os.urandom(10_000)
+    out = io.BytesIO()
+    assert crypto.encrypt_stream(io.BytesIO(plain), out, chunk_size=1024) == len(plain)
+    return crypto, plain, out.getvalue()
+
+
+def test_stream_round_trip(sealed):
+    crypto, plain, data = sealed
+    out = io.BytesIO()
+    assert crypto.decrypt_stream(io.BytesIO(data), out) == len(plain)
+    assert out.getvalue() == plain
+    # Ciphertext is stored raw, not base64
+    assert len(data) < len(plain) * 1.15
+
+    empty = io.BytesIO()
+    crypto.encrypt_stream(io.BytesIO(b""), empty)
+    out = io.BytesIO()
+    assert crypto.decrypt_stream(io.BytesIO(empty.getvalue()), out) == 0
+
+
+def test_stream_mode_is_respected(sealed):
+    crypto, _, data = sealed
+    assert data[0] == {"fernet": 0x01, "aesgcm": 0x02}[crypto.mode]
+
+
+def tampered_streams(data):
+    header, found = frames(data)
+    yield "truncated", data[:-1]
+    yield "no final frame", join(header, found[:-1])
+    yield "dropped frame", join(header, found[:3] + found[4:])
+    yield "reordered", join(header, [found[1], found[0]] + found[2:])
+    yield "replayed", join(header, found[:2] + found[1:])
+    yield "trailing data", data + data[12:24]
+    final_early = (int.from_bytes(found[2][0], 'big') | 0x80000000).to_bytes(4, 'big')
+    yield "final flag forged", join(header, found[:2] + [(final_early, found[2][1])])
+    yield "huge frame length", header + (0x7FFFFFFF).to_bytes(4, 'big') + b"x" * 16
+    yield "chunk size forged", header[:8] + (1 << 30).to_bytes(4, 'big') + data[12:]
+    yield "chunk size shrunk", header[:8] + (16).to_bytes(4, 'big') + data[12:]
+    yield "chunk size raised", header[:8] + (4096).to_bytes(4, 'big') + data[12:]
+    flipped = bytearray(data)
+    flipped[-1] ^= 1
+    yield "flipped bit", bytes(flipped)
+
+
+def test_stream_rejects_tampering(sealed):
+    crypto, _, data = sealed
+    other = io.BytesIO()
+    crypto.encrypt_stream(io.BytesIO(os.urandom(10_000)), other, chunk_size=1024)
+    header, found = frames(data)
+    spliced = join(header, found[:2] + frames(other.getvalue())[1][2:])
+    for name, bad in list(tampered_streams(data)) + [("spliced", spliced)]:
+        with pytest.raises(ValueError):
+            crypto.decrypt_stream(io.BytesIO(bad), io.BytesIO())
+            pytest.fail(name)
+
+
+def test_key_cache_file_is_private(tmp_path):
+    cache_file = tmp_path / "keys.json"
+    key = derive_key(b"cache-test", b"salt", 1000, cache_file=str(cache_file))
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+    clear_key_cache()
+    assert derive_key(b"cache-test", b"salt", 1000, cache_file=str(cache_file)) == key
+
+
+def test_key_derivations_do_not_serialise():
+    """A slow derivation must not hold up a different key."""
+    clear_key_cache()
+    slow = threading.Thread(target=derive_key, args=(b"slow", b"salt", 2_000_000))
+    slow.start()
+    time.sleep(0.05)
+    started = time.perf_counter()
+    derive_key(b"fast", b"salt", 1000)
+    elapsed = time.perf_counter() - started
+    slow.join()
+    assert elapsed < 0.2
+
+
+def test_envelopes_round_trip_in_both_modes():
+    for mode in ("fernet", "aesgcm"):
+        crypto = CryptoOperations(mode=mode)
+        for text in ("", "x", "root:x:0:0\n" * 200):
+            assert crypto.decrypt(crypto.encrypt(text)) == text
+        envelope = crypto.encrypt_bytes(b"payload")
+        assert envelope[0] == {"fernet": 0x01, "aesgcm": 0x02}[mode]
+        assert crypto.decrypt_bytes(envelope) == b"payload"
+    # Each mode reads the other's envelopes: the version byte decides
+    fernet, aesgcm = CryptoOperations(mode="fernet"), CryptoOperations(mode="aesgcm")
+    assert fernet.decrypt(aesgcm.encrypt("swap")) == "swap"
+    assert aesgcm.decrypt(fernet.encrypt("swap")) == "swap"
+
+
+def test_throttle_is_shared_across_instances():
+    assert CryptoOperations().throttle is CryptoOperations().throttle
+
+
+def test_flooding_the_table_keeps_lockouts():
+    throttle = LoginThrottle(max_failures=1, max_tracked=10)
+    assert throttle.acquire("admin")
+    throttle.release("admin", False)
+    assert throttle.retry_after("admin") > 0
+    for i in range(100):
+        if throttle.acquire(f"junk{i}"):
+            throttle.release(f"junk{i}", False)
+    assert len(throttle) <= 10
+    assert throttle.retry_after("admin") > 0
+    assert not throttle.acquire("admin")
@@ -0,0 +1,28 @@
+from src.crypto_utils import CryptoOperations
+from src.remote_server import FileNode, RemoteServer
+
+
+def test_encrypted_node_hides_ciphertext():
+    crypto = CryptoOperations()
+    envelope = crypto.encrypt_bytes("launch codes".encode())
+    node = FileNode("codes.txt", envelope, is_encrypted=True)
+    assert node.content is None
+    assert node.raw_content == envelope
+    assert crypto.decrypt_bytes(node.raw_content) == b"launch codes"
+
+    plain = FileNode("notes.txt", "héllo")
+    assert plain.content == "héllo"
+    assert plain.raw_content == "héllo".encode()
+
+
+def test_every_server_file_reads_or_reports_encrypted():
+    server = RemoteServer()
+    encrypted = 0
+    for path, node in server.iter_files():
+        if node.is_encrypted:
+            encrypted += 1
+            assert node.content is None
+            assert "encrypted" in server.handle_command(f"cat {path}").lower()
+        else:
+            assert isinstance(node.content, str)
+    assert encrypted
@@ -0,0 +1,41 @@
+import threading
+import time
+
+from src.log_generator import LOG_POOL_SIZE, LogGenerator
+from src.log_stream import LogStream
+
+
+def test_shared_generator_across_threads():
+    """Threads drawing from one generator leave its pool consistent."""
+    generator = LogGenerator()
+    errors = []
+
+    def draw():
+        try:
+            for _ in range(50):
+                for line in generator.generate_logs(300, block_size=100):
+                    assert line[:2] == "20" and "] " in line
+        except Exception as exc:  # Surface failures from worker threads
+            errors.append(exc)
+
+    threads = [threading.Thread(target=draw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    for slot, entry in enumerate(generator._pool_unique):
+        assert set(generator._pool[slot::LOG_POOL_SIZE]) == {entry}
+
+
+def test_streams_share_a_generator():
+    generator = LogGenerator()
+    streams = [LogStream(f"/var/log/{i}.log", generator, rate=2000).start() for i in range(3)]
+    try:
+        time.sleep(0.5)
+        for stream in streams:
+            lines, _ = stream.pending()
+            assert lines and all("] " in line for line in lines)
+    finally:
+        for stream in streams:
+            stream.stop()
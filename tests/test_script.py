@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+import main
+from src.commands import Command
+
+
+@pytest.fixture
+def failing_command():
+    main.HomeComputer.commands.register(
+        Command('explode', lambda shell, args: 1 / 0, "Always fails"))
+    yield
+    main.HomeComputer.commands.unregister('explode')
+
+
+def write_script(tmp_path, *lines):
+    path = tmp_path / "scenario.txt"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_clean_script_exits_zero(tmp_path, capsys):
+    assert main.run_scripts([write_script(tmp_path, "dir", "ver")], 'text') == 0
+    assert "0 error(s)" in capsys.readouterr().err
+
+
+def test_errors_are_counted_and_fail_the_run(tmp_path, capsys, failing_command):
+    script = write_script(tmp_path, "dir", "explode", "explode", "ver")
+    assert main.run_scripts([script], 'jsonl') == 1
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [bool(record['error']) for record in records] == [False, True, True, False]
+    summary = json.loads(captured.err)
+    assert (summary['commands'], summary['errors']) == (4, 2)
+
+    assert main.run_scripts([script], 'text') == 1
+    captured = capsys.readouterr()
+    assert captured.out.count("Command error: division by zero") == 2
+    assert "2 error(s)" in captured.err
+
+
+def test_unreadable_script_is_an_error(tmp_path, capsys):
+    missing = str(tmp_path / "missing.txt")
+    assert main.run_scripts([missing, write_script(tmp_path, "dir")], 'text') == 1
+    err = capsys.readouterr().err
+    assert "Cannot read script" in err and "1 error(s)" in err
+
+
+def test_games_are_refused_in_batch_mode(tmp_path, capsys):
+    script = write_script(tmp_path, "cd games", "run snake.exe", "dir")
+    assert main.run_scripts([script], 'jsonl') == 1
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert "interactive terminal" in records[1]['error']
+    assert json.loads(captured.err)['errors'] == 1
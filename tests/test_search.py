@@ -0,0 +1,134 @@
+import random
+import re
+
+import pytest
+
+from src.remote_server import RemoteServer
+from src.search_index import SearchIndex, Vocabulary
+
+
+def grep_l(server, *args):
+    output = server.handle_command("grep -l " + " ".join(args))
+    return output.split("\n") if output else []
+
+
+def naive(server, needle, ignore_case=False):
+    """Every readable file containing needle, found by scanning."""
+    if ignore_case:
+        needle = needle.lower()
+    found = []
+    for path, node in server.iter_files():
+        text = server._plaintext(path, node)
+        if text is None:
+            continue
+        if needle in (text.lower() if ignore_case else text):
+            found.append(path)
+    return sorted(found)
+
+
+@pytest.fixture
+def server():
+    return RemoteServer()
+
+
+@pytest.mark.parametrize("pattern", ["ontainment", "Contain", "773", "Containment"])
+def test_partial_words_match_like_substrings(server, pattern):
+    assert grep_l(server, pattern) == naive(server, pattern)
+    assert grep_l(server, pattern)
+
+
+def test_partial_words_ignore_case(server):
+    assert grep_l(server, "-i", "sect") == naive(server, "sect", ignore_case=True)
+    assert grep_l(server, "-i", '"ment breach"') == naive(server, "ment breach", ignore_case=True)
+    assert grep_l(server, "-i", '"ment breach"')
+
+
+def test_phrase(server):
+    assert grep_l(server, '"Containment Breach"') == ["/home/security/incident_report_17.txt"]
+    assert grep_l(server, '"Breach Containment"') == []
+
+
+def test_random_substrings_match_a_scan(server):
+    rng = random.Random(7)
+    texts = [node.content for _, node in server.iter_files() if not node.is_encrypted]
+    for _ in range(300):
+        text = rng.choice(texts)
+        start = rng.randrange(len(text))
+        needle = text[start:start + rng.randint(1, 20)].strip()
+        # grep is line-based and its arguments pass through shlex
+        if (not needle or re.search(r"[\s\"'\\]", needle.replace(" ", "x"))
+                or "  " in needle or needle.startswith("-")):
+            continue
+        quoted = '"' + needle + '"'
+        assert grep_l(server, quoted) == naive(server, needle), needle
+        assert grep_l(server, "-i", quoted) == naive(server, needle, ignore_case=True), needle
+
+
+def test_regex(server):
+    expected = sorted(path for path, node in server.iter_files() if not node.is_encrypted
+                      and re.search(r"Contain\w+ B", node.content))
+    assert grep_l(server, "-E", r'"Contain\w+ B"') == expected
+    assert expected
+    assert server.handle_command("grep -E '('").startswith("grep: invalid regex")
+
+
+def test_grep_prints_matching_lines_in_scope(server):
+    output = server.handle_command("grep ontainment /var/log")
+    assert output
+    for line in output.split("\n"):
+        path, _, text = line.partition(": ")
+        assert path.startswith("/var/log/") and "ontainment" in text
+
+
+def test_encrypted_files_are_searchable_only_after_decrypt(server):
+    assert "/etc/shadow" not in grep_l(server, "researcher")
+    server.handle_command("decrypt /etc/shadow")
+    assert "/etc/shadow" in grep_l(server, "researcher")
+
+
+def test_sessions_shadow_the_shared_index():
+    first, second = RemoteServer(), RemoteServer()
+    first._add_file("/home/admin/notes.txt", "the quasar protocol")
+    first._add_file("/var/log/auth.log", "rewritten by this session")
+
+    assert grep_l(first, "quasar") == ["/home/admin/notes.txt"]
+    assert grep_l(second, "quasar") == []
+    # The replaced file no longer matches its shared content in this session only
+    assert "/var/log/auth.log" not in grep_l(first, "Containment")
+    assert "/var/log/auth.log" in grep_l(second, "Containment")
+    assert grep_l(first, "rewritten") == ["/var/log/auth.log"]
+    assert grep_l(second, "rewritten") == []
+
+
+def test_index_remove_hides_base_entry():
+    contents = {"/a": "alpha beta", "/b": "beta gamma"}
+    base = SearchIndex(contents.get)
+    for path, text in contents.items():
+        base.add(path, text)
+    overlay = SearchIndex(contents.get, base=base)
+    overlay.remove("/a")
+    assert overlay.search("eta") == ["/b"]
+    assert base.search("eta") == ["/a", "/b"]
+
+
+def test_vocabulary_matches_like_a_scan():
+    rng = random.Random(3)
+    words = {"".join(rng.choices("abcde", k=rng.randint(1, 6))) for _ in range(2000)}
+    vocabulary = Vocabulary(words)
+    for part in ("a", "ab", "cab", "eed", "abcde", "zz"):
+        for open_left, open_right, keep in ((False, True, str.startswith),
+                                            (True, False, str.endswith),
+                                            (True, True, str.__contains__)):
+            expected = sorted(word for word in words if keep(word, part))
+            found = vocabulary.matching(part, open_left, open_right, limit=len(words))
+            assert sorted(found) == expected, (part, open_left, open_right)
+    assert vocabulary.matching("a", True, True, limit=5) is None
+
+
+def test_search_matches_whole_words(server):
+    output = server.handle_command("search containment")
+    assert output.endswith("file(s)")
+    assert server.handle_command("search ontainment").startswith("search: no files")
+    # Both words, in any order and anywhere in the file
+    both = server.handle_command("search breach containment").split("\n\n")[0].split("\n")
+    assert "/home/security/incident_report_17.txt" in both
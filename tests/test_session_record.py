@@ -0,0 +1,79 @@
+import io
+import random
+
+import pytest
+
+from src import session_record
+from src.ascii_games import DiffRenderer
+from src.session_record import SessionPlayer, SessionRecorder, VirtualScreen
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.01
+        return self.now
+
+
+def screen_of(text, size=(40, 12)):
+    screen = VirtualScreen(*size)
+    screen.feed(text)
+    return screen.grid, screen.x, screen.y, screen.attr, screen.cursor_visible
+
+
+def test_virtual_screen_follows_diff_renderer():
+    out = io.StringIO()
+    renderer = DiffRenderer(out)
+    rng = random.Random(3)
+    for _ in range(50):
+        rows = [[rng.choice(" ox") for _ in range(30)] for _ in range(rng.randint(5, 10))]
+        renderer.render(rows)
+        grid = screen_of(out.getvalue())[0]
+        for y in range(12):
+            expected = "".join(rows[y]) if y < len(rows) else ""
+            assert "".join(char for _, char in grid[y]).rstrip() == expected.rstrip()
+
+
+def test_virtual_screen_handles_split_escapes_and_scrolling():
+    text = "\033[1;31mred\033[0m plain\n" + "".join(f"line {i}\n" for i in range(20))
+    whole = screen_of(text)
+    for cut in range(1, len(text)):
+        screen = VirtualScreen(40, 12)
+        screen.feed(text[:cut])
+        screen.feed(text[cut:])
+        assert (screen.grid, screen.x, screen.y, screen.attr) == whole[:4]
+    # The redraw reproduces the screen, colours included
+    redrawn = VirtualScreen(40, 12)
+    redrawn.feed(VirtualScreen(40, 12).redraw())
+    assert redrawn.touched is False
+    screen = VirtualScreen(40, 12)
+    screen.feed("\033[1;31mred\033[0m plain")
+    assert screen_of(screen.redraw()) == screen_of("\033[1;31mred\033[0m plain")
+
+
+def test_seeking_into_diff_frames_restores_the_screen(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_record, "KEYFRAME_BYTES", 0)
+    path = str(tmp_path / "game.rec")
+    clock = FakeClock()
+    recorder = SessionRecorder(path, keyframe_interval=0.5, clock=clock, size=(40, 12))
+    stream = recorder.tee(io.StringIO())
+    recorder.input("snake")
+    renderer = DiffRenderer(stream)
+    rng = random.Random(5)
+    for _ in range(200):
+        renderer.render([[rng.choice(" .o") for _ in range(30)] for _ in range(8)])
+        clock.now += 0.05
+    renderer.close()
+    stream.write("Game over\n")
+    recorder.close()
+
+    player = SessionPlayer(path)
+    assert len(player.index) > 10
+    full = io.StringIO()
+    player.play(full, speed=None)
+    for at_ms, _ in player.index:
+        seeked = io.StringIO()
+        player.play(seeked, speed=None, start=at_ms / 1000)
+        assert screen_of(seeked.getvalue()) == screen_of(full.getvalue())
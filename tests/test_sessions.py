@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+from src.remote_server import RemoteServer
+from src.session_server import serve
+
+
+class SlowServer(RemoteServer):
+    commands = RemoteServer.commands.copy()
+
+
+@SlowServer.commands.command('stall', "Block until released")
+def stall(server, args):
+    server.release.wait(3)
+    return "stalled"
+
+
+async def prompt(reader):
+    return (await reader.readuntil(b"> ")).decode()
+
+
+async def connect(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await prompt(reader)  # Banner and first prompt
+    return reader, writer
+
+
+def test_slow_command_does_not_block_other_sessions():
+    release = threading.Event()
+
+    def factory():
+        server = SlowServer()
+        server.release = release
+        return server
+
+    async def scenario():
+        listener = await serve(port=0, server_factory=factory)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            slow_reader, slow_writer = await connect(port)
+            fast_reader, fast_writer = await connect(port)
+
+            started = time.perf_counter()
+            slow_writer.write(b"stall\r\n")
+            await slow_writer.drain()
+            await asyncio.sleep(0.05)
+
+            fast_writer.write(b"pwd\r\n")
+            await fast_writer.drain()
+            reply = await asyncio.wait_for(prompt(fast_reader), 2)
+            elapsed = time.perf_counter() - started
+            assert "/home" in reply
+
+            release.set()
+            assert "stalled" in await asyncio.wait_for(prompt(slow_reader), 2)
+            for writer in (slow_writer, fast_writer):
+                writer.close()
+            return elapsed
+
+    assert asyncio.run(scenario()) < 1.0
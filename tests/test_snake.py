@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src.ascii_games import SnakeGame
+
+
+def crash(game):
+    """Put a body segment just ahead of the head so the next step dies."""
+    hx, hy = game.snake[0]
+    dx, dy = game.direction
+    ahead = ((hx + dx) % game.width, (hy + dy) % game.height)
+    if ahead == game.food:
+        game.food = game._place_food()
+    game.snake.append(ahead)
+    game.occupied.add(ahead)
+    game.free.remove(ahead)
+
+
+def test_death_is_penalised_once():
+    game = SnakeGame(8, 6, seed=1)
+    crash(game)
+    _, reward, done = game.step()
+    assert (reward, done) == (-1, True)
+    for action in (None, 'd', 'q'):
+        assert game.step(action)[1:] == (0, True)
+
+
+def test_quitting_is_not_a_death():
+    game = SnakeGame(8, 6, seed=1)
+    _, reward, done = game.step('q')
+    assert (reward, done) == (0, True)
+    assert game.step()[1:] == (0, True)
+
+
+def test_batch_matches_single_game():
+    """BatchSnake follows SnakeGame tick for tick given the same food."""
+    np = pytest.importorskip("numpy")
+    from src.snake_sim import KEYS, BatchSnake
+
+    rng = random.Random(11)
+    for seed in range(20):
+        width, height = rng.choice([(6, 4), (8, 6), (20, 10)])
+        game = SnakeGame(width, height, seed=seed)
+        batch = BatchSnake(1, width, height, seed=seed)
+        batch.food[0] = game.food
+        for _ in range(400):
+            turn = rng.randrange(4) if rng.random() < 0.3 else -1
+            _, reward, done = game.step(KEYS[turn] if turn >= 0 else None)
+            _, batch_reward, batch_done = batch.step(np.array([turn]))
+            assert (reward, done) == (int(batch_reward[0]), bool(batch_done[0]))
+            assert game.score == batch.score[0]
+            assert game.snake[0] == tuple(batch.head[0])
+            cells = {(int(x), int(y)) for y, x in np.argwhere(batch.grid[0] > 0)}
+            assert cells == game.occupied
+            if done:
+                break
+            batch.food[0] = game.food  # Food placement uses different generators
+
+
+def test_run_games_handles_no_games():
+    from src.snake_sim import greedy_agent, run_games
+    stats = run_games(greedy_agent, 0)
+    assert (stats['games'], stats['mean_score'], stats['max_score']) == (0, 0.0, 0)
+    assert run_games(greedy_agent, 3, seed=1)['games'] == 3